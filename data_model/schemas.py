@@ -21,6 +21,13 @@ class ChangeFormat(BaseModel):
 class SummaryResponse(RootModel[list[ChangeFormat]]):
     pass
 
+class LLMProviderConfig(BaseModel):
+    """One entry of the config's "llm" block, validated once at load time."""
+    provider: str = Field(min_length=1)
+    model_name: str = Field(min_length=1)
+    temperature: float = 0.2
+    max_output_tokens: int = 2048
+
 class PromptType(str, Enum):
     DOCUMENT_ANALYSIS = "document_analysis"
     DOCUMENT_COMPARISON = "document_comparison"
@@ -2,37 +2,34 @@ import traceback
 from typing import Union
 from logger.custom_logger import CustomLogger
 
-logger = CustomLogger().get_logger(__name__)
-
 class DocumentPortalException(Exception):
     """Custom Exception handling for Document Portal"""
 
     def __init__(self, error: Union[BaseException, str]):
-        # Decide how to extract message and location/trace
+        # Decide how to extract message and location.
+        # No traceback text is built here: the original exception keeps its own
+        # __traceback__, and the logger's format_exc_info renders it exactly once
+        # when the error is logged with exc_info.
         if isinstance(error, BaseException):
             tb = error.__traceback__
             if tb:
                 last = traceback.extract_tb(tb)[-1]                  # original error site
-                tb_str = ''.join(traceback.format_exception(type(error), error, tb))
             else:
                 # Freshly constructed exception, no traceback yet -> use caller's frame
                 stack = traceback.extract_stack(limit=3)
                 last = stack[-2] if len(stack) >= 2 else None
-                tb_str = ''.join(traceback.format_stack())
             msg = str(error)
         else:
-            # Plain string message -> use caller's frame and current stack
+            # Plain string message -> use caller's frame
             msg = str(error)
             stack = traceback.extract_stack(limit=3)
             last = stack[-2] if len(stack) >= 2 else None
-            tb_str = ''.join(traceback.format_stack())
 
         # Populate fields
         self.filename = getattr(last, "filename", None)
         self.lineno   = getattr(last, "lineno", None)
         self.funcname = getattr(last, "name", None)
         self.error_message = msg
-        self.traceback_str = tb_str
 
         super().__init__(self.error_message)
 
@@ -42,11 +39,12 @@ class DocumentPortalException(Exception):
 
 
 if __name__ == "__main__":
+    logger = CustomLogger().get_logger(__name__)
     try:
         # Simulate an error
         a = 1 / 0
         print(a)
     except Exception as e:
         app_exc = DocumentPortalException(e)
-        logger.exception("%s", app_exc)            # pretty console + JSON file with traceback
+        logger.error("%s", app_exc, exc_info=e)    # traceback rendered once by the logger
         raise app_exc from e                        # keep clear causal chain
@@ -1,103 +1,356 @@
 import os
+import sys
+import atexit
+import functools
+import queue
+import threading
+import time
 from datetime import datetime, timezone
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import orjson
 import structlog
 
 
+def _orjson_dumps(obj, **kwargs) -> str:
+    """JSONRenderer serializer backed by orjson; returns str for ProcessorFormatter."""
+    return orjson.dumps(
+        obj,
+        default=kwargs.get("default"),
+        option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
+# One log file per process, named once at import time
+_LOG_FILE_NAME = datetime.now(timezone.utc).strftime('%m_%d_%Y_%H_%M_%S') + ".log"
+
+# Serializes the one-time configuration across threads importing modules concurrently
+_CONFIG_LOCK = threading.Lock()
+# Serializes the lazy listener start across threads logging their first records
+_LISTENER_LOCK = threading.Lock()
+
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+
+def _maybe_format_exc_info(logger, method_name, event_dict):
+    """Run format_exc_info only for records that actually carry exc_info."""
+    if "exc_info" in event_dict:
+        return structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
+def _maybe_render_stack_info(logger, method_name, event_dict):
+    """Run StackInfoRenderer only for records that asked for stack_info."""
+    if "stack_info" in event_dict:
+        return _stack_info_renderer(logger, method_name, event_dict)
+    return event_dict
+
+
+def _add_record_timestamp(logger, method_name, event_dict):
+    """
+    Stamp a foreign (stdlib) record with the time it was created.
+
+    Foreign records are only formatted later, on the listener thread, so a
+    TimeStamper here would record when they were written out, not emitted.
+    Same ISO-8601 UTC format as the structlog chain's TimeStamper.
+    """
+    record = event_dict.get("_record")
+    if record is not None:
+        created = datetime.fromtimestamp(record.created, tz=timezone.utc)
+    else:
+        created = datetime.now(tz=timezone.utc)
+    event_dict["timestamp"] = created.isoformat().replace("+00:00", "Z")
+    return event_dict
+
+
+class _CachedCallsiteAdder:
+    """
+    Add filename / func_name / lineno / module to each event dict.
+
+    Drop-in replacement for structlog's CallsiteParameterAdder: the
+    per-code-object parts (file basename, module) are computed once and
+    memoized, so each record only pays a short frame walk and a dict hit.
+    """
+    __slots__ = ("cache",)
+
+    # Frames from these modules belong to the logging machinery, not the caller
+    _IGNORED_PACKAGES = frozenset(("structlog", "logging"))
+
+    def __init__(self) -> None:
+        self.cache = {}
+
+    def __call__(self, logger, method_name, event_dict):
+        record = event_dict.get("_record")
+        if record is not None:
+            # Foreign (stdlib) record: the LogRecord already carries the callsite
+            event_dict["filename"] = record.filename
+            event_dict["func_name"] = record.funcName
+            event_dict["lineno"] = record.lineno
+            event_dict["module"] = record.module
+            return event_dict
+
+        frame = sys._getframe(1)
+        while frame is not None and (
+            frame.f_globals.get("__name__", "").partition(".")[0] in self._IGNORED_PACKAGES
+            or frame.f_code.co_filename == __file__
+        ):
+            frame = frame.f_back
+        if frame is None:
+            return event_dict
+
+        code = frame.f_code
+        entry = self.cache.get(code)
+        if entry is None:
+            filename = os.path.basename(code.co_filename)
+            entry = (filename, code.co_name, os.path.splitext(filename)[0])
+            self.cache[code] = entry
+
+        event_dict["filename"], event_dict["func_name"], event_dict["module"] = entry
+        event_dict["lineno"] = frame.f_lineno
+        return event_dict
+
+
+# Processors are stateless (or, for the callsite cache, safely shareable), so the
+# chains are built once at import and shared by every handler/logger.
+
+# One memoizing callsite processor shared by both chains
+_CALLSITE = _CachedCallsiteAdder()
+
+# Common enrichers before rendering (applied for both console and file)
+_PRE_CHAIN = (
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    _maybe_render_stack_info,
+    _maybe_format_exc_info,                                        # -> stringified traceback
+    _add_record_timestamp,                                         # emit time, not format time
+    structlog.processors.EventRenamer(to="event"),
+    _CALLSITE,
+)
+
+# structlog-side chain; final rendering is deferred to the handler formatters
+_PROCESSORS = (
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    _maybe_render_stack_info,
+    _maybe_format_exc_info,
+    structlog.processors.TimeStamper(fmt="iso", key="timestamp", utc=True),
+    _CALLSITE,
+    structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+)
+
+
+class _PassThroughQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records untouched.
+
+    The default prepare() pre-formats the message and drops exc_info, which
+    would strip the event dict that ProcessorFormatter expects. The queue is
+    in-process, so the record can be handed over as-is.
+
+    The first record also starts the listener (and with it the log file), so
+    a process that never logs, such as a PDF extraction worker re-importing
+    the entry point, creates no file and no thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if CustomLogger._listener is None:
+            CustomLogger._start_listener()
+        super().emit(record)
+
+
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler whose stream buffer coalesces records into larger writes.
+
+    The stock handler flushes after every record and re-checks the file size
+    with seek/tell (which also flushes), costing at least one write syscall
+    per log line. Here the size is tracked in memory and the stream is
+    flushed when its buffer fills, on rollover, on close, for every ERROR or
+    worse record (so a crash right after it cannot lose it), and
+    periodically by _FlushingQueueListener.
+    """
+
+    def __init__(self, filename: str, buffer_size: int = 64 * 1024, **kwargs) -> None:
+        self.buffer_size = buffer_size
+        super().__init__(filename, **kwargs)
+        self._bytes_written = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.maxBytes > 0 and self._bytes_written and self._bytes_written + len(msg) >= self.maxBytes:
+                self.doRollover()
+                self._bytes_written = 0
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += len(msg)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(QueueListener):
+    """
+    QueueListener that also flushes its handlers at least every flush_interval
+    seconds while records are buffered, bounding how much a SIGKILL or
+    OOM-kill can lose from the buffered file handler.
+    """
+
+    def __init__(self, *args, flush_interval: float = 1.0, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.flush_interval = flush_interval
+        self._next_flush = None
+
+    def dequeue(self, block: bool):
+        if not block:
+            return super().dequeue(block)
+        while True:
+            now = time.monotonic()
+            if self._next_flush is not None and now >= self._next_flush:
+                for handler in self.handlers:
+                    handler.flush()
+                self._next_flush = None
+            try:
+                # Wait without a timeout when nothing is pending a flush
+                timeout = None if self._next_flush is None else self._next_flush - now
+                record = self.queue.get(True, timeout)
+            except queue.Empty:
+                continue
+            if self._next_flush is None:
+                self._next_flush = now + self.flush_interval
+            return record
+
 
 class CustomLogger:
     """
     A structured JSON logger for the 'Document Portal' project.
 
       - Sends logs to BOTH console and file (JSON lines).
+      - Writes happen on a background QueueListener thread, off the caller's path.
       - Uses structlog so logs are structured (key/value), easy to parse & search.
       - call CustomLogger().get_logger(__name__).
     """
     # Class level gaurd to avoid configuring logger multiple times in multi-import scenarios
     _configured: bool = False
+    # Set once by the first instance; shared by every later instance
+    logs_dir: str = None
+    log_file_path: str = None
+    # Background listener doing the actual console/file writes (kept referenced on the class);
+    # started on the first record, see _PassThroughQueueHandler
+    _listener: QueueListener = None
+    _log_queue: queue.SimpleQueue = None
+    _level: int = logging.INFO
 
     def __init__(self, logs_dir: str = "logs",
                  level: int = logging.INFO) -> None:
 
-        # Ensure ./logs directory exists
-        self.logs_dir = os.path.join(os.getcwd(), logs_dir)
-        os.makedirs(self.logs_dir, exist_ok=True)
-
-        # Create timestamped log file name
-        log_file_name = datetime.now(timezone.utc).strftime('%m_%d_%Y_%H_%M_%S') + ".log"
-        self.log_file_path = os.path.join(self.logs_dir, log_file_name)
-
         self.level = level
 
+        # Directory creation, file naming and handler wiring happen only once
+        # per process; later instances are just handles for get_logger()
         if not CustomLogger._configured:
-            self._configure_stdlib_and_structlog()
-            CustomLogger._configured = True
+            with _CONFIG_LOCK:
+                # Re-check under the lock: another thread may have configured meanwhile
+                if not CustomLogger._configured:
+                    self._init_once(logs_dir)
+                    CustomLogger._configured = True
+
+    def _init_once(self, logs_dir: str) -> None:
+        # ./logs itself is created with the file, when the listener starts
+        CustomLogger.logs_dir = os.path.join(os.getcwd(), logs_dir)
+
+        # Timestamped log file name is fixed for the process lifetime
+        CustomLogger.log_file_path = os.path.join(self.logs_dir, _LOG_FILE_NAME)
+
+        self._configure_stdlib_and_structlog()
 
 
     def _configure_stdlib_and_structlog(self) -> None:
-        # Common enrichers before rendering (applied for both console and file)
-        pre_chain = [
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,                          # -> stringified traceback
-            structlog.processors.TimeStamper(fmt="iso", key="timestamp", utc=True),
-            structlog.processors.EventRenamer(to="event"),
-            structlog.processors.CallsiteParameterAdder(parameters=(
-                structlog.processors.CallsiteParameter.FILENAME,
-                structlog.processors.CallsiteParameter.FUNC_NAME,
-                structlog.processors.CallsiteParameter.LINENO,
-                structlog.processors.CallsiteParameter.MODULE,
-            )),
-        ]
-
-        # Console: pretty/human friendly
-        console = logging.StreamHandler()
-        console.setLevel(self.level)
-        console.setFormatter(
-            structlog.stdlib.ProcessorFormatter(
-                processor=structlog.dev.ConsoleRenderer(sort_keys=False),
-                foreign_pre_chain=pre_chain,
-            )
-        )
+        root = logging.getLogger()
+        if any(isinstance(h, QueueHandler) for h in root.handlers):
+            # Already wired (e.g. module reloaded); adding another queue and
+            # listener would emit every record twice
+            return
 
-        # File: strict JSON, one record per line
-        file_handler = logging.FileHandler(self.log_file_path, encoding="utf-8")
-        file_handler.setLevel(self.level)
-        file_handler.setFormatter(
-            structlog.stdlib.ProcessorFormatter(
-                processor=structlog.processors.JSONRenderer(),
-                foreign_pre_chain=pre_chain,
-            )
-        )
+        # Root logger only enqueues; a single listener thread performs the I/O
+        # so logging calls never block the request path on console/file writes
+        CustomLogger._log_queue = queue.SimpleQueue()
+        CustomLogger._level = self.level
 
         # Root logger wiring
-        root = logging.getLogger()
         root.setLevel(self.level)
         # avoid duplicate handlers across re-imports
         for h in list(root.handlers):
             root.removeHandler(h)
-        root.addHandler(console)
-        root.addHandler(file_handler)
+        root.addHandler(_PassThroughQueueHandler(CustomLogger._log_queue))
 
-        # Defer final rendering to handler formatters
+        # Defer final rendering to handler formatters. The filtering wrapper
+        # turns calls below the configured level into no-ops before any
+        # processor runs, and gives callers is_enabled_for() to guard costly
+        # log arguments.
         structlog.configure(
-            processors=[
-                structlog.stdlib.filter_by_level,
-                structlog.stdlib.add_logger_name,
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.PositionalArgumentsFormatter(),
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
-                structlog.processors.TimeStamper(fmt="iso", key="timestamp", utc=True),
-                structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-            ],
+            processors=list(_PROCESSORS),
+            wrapper_class=structlog.make_filtering_bound_logger(self.level),
             logger_factory=structlog.stdlib.LoggerFactory(),
             cache_logger_on_first_use=True,
         )
 
-    def get_logger(self, path=__file__):
-        # Getting the file name from the file path
+    @classmethod
+    def _start_listener(cls) -> None:
+        """Create the console/file handlers and start the listener, once per process."""
+        with _LISTENER_LOCK:
+            if cls._listener is not None:
+                return
+            os.makedirs(cls.logs_dir, exist_ok=True)
+
+            # Console: pretty/human friendly
+            console = logging.StreamHandler()
+            console.setLevel(cls._level)
+            console.setFormatter(
+                structlog.stdlib.ProcessorFormatter(
+                    processor=structlog.dev.ConsoleRenderer(sort_keys=False),
+                    foreign_pre_chain=_PRE_CHAIN,
+                )
+            )
+
+            # File: strict JSON, one record per line
+            file_handler = _BufferedRotatingFileHandler(
+                cls.log_file_path,
+                maxBytes=10_000_000,
+                backupCount=5,
+                encoding="utf-8",
+            )
+            file_handler.setLevel(cls._level)
+            file_handler.setFormatter(
+                structlog.stdlib.ProcessorFormatter(
+                    processor=structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+                    foreign_pre_chain=_PRE_CHAIN,
+                )
+            )
+
+            listener = _FlushingQueueListener(cls._log_queue, console, file_handler, respect_handler_level=True)
+            listener.start()
+            # Stop the listener (drains the queue), then flush the buffered file stream
+            atexit.register(file_handler.flush)
+            atexit.register(listener.stop)
+            cls._listener = listener
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def get_logger(cls, path=__file__):
+        # Getting the file name from the file path; cached per path since
+        # every module asks for the same logger on each instantiation
         logger_name =  os.path.basename(path)
         return structlog.get_logger(logger_name)
 
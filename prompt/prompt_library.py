@@ -1,8 +1,10 @@
-from langchain_core.prompts import ChatPromptTemplate
+import string
+from functools import cache
+from typing import Callable
 from enum import Enum
 
 # Prompt for document analysis
-document_analysis_prompt = ChatPromptTemplate.from_template("""
+DOCUMENT_ANALYSIS_TEMPLATE = """
 You are a highly capable assistant trained to analyze and summarize documents.
 Return ONLY valid JSON matching the exact schema below
                                           
@@ -12,10 +14,10 @@ Analyze this document:
 {document_text}
 
 Remember: Output must be valid JSON only, no additional commentary.
-""")
+"""
 
 # Prompt for document comparison
-document_comparison_prompt = ChatPromptTemplate.from_template("""
+DOCUMENT_COMPARISON_TEMPLATE = """
 You are a document comparison assistant. 
 
 You will receive two versions of a PDF document (V1 and V2). Each is split page by page.
@@ -37,19 +39,71 @@ Version 2 (V2):
 Your response must be a JSON array following this schema:
 
 {format_instruction}
-""")
+"""
 
 # Prompt for contextualize question
-contextualize_question_prompt = ChatPromptTemplate.from_template("""
-""")
+CONTEXTUALIZE_QUESTION_TEMPLATE = """
+"""
 
 # Prompt for context qa
-context_qa_prompt = ChatPromptTemplate.from_template("""
-""")
+CONTEXT_QA_TEMPLATE = """
+"""
 
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Pre-split a template into (literal, field) fragments once at import time.
+
+    The returned renderer is a single join over those fragments, so per-call
+    rendering skips LangChain's template parsing and PromptValue/message wrapping.
+    Its output is the text ChatPromptTemplate.from_template would place in the
+    single human message.
+    """
+    fragments = tuple(
+        (literal, field) for literal, field, _, _ in string.Formatter().parse(template)
+    )
+
+    def render(**kwargs) -> str:
+        return "".join(
+            literal if field is None else literal + str(kwargs[field])
+            for literal, field in fragments
+        )
+
+    return render
+
+def _chat_prompt(template: str):
+    # Deferred import: langchain_core.prompts is only loaded when a
+    # ChatPromptTemplate is actually requested
+    from langchain_core.prompts import ChatPromptTemplate
+    return ChatPromptTemplate.from_template(template)
+
+@cache
+def document_analysis_prompt():
+    return _chat_prompt(DOCUMENT_ANALYSIS_TEMPLATE)
+
+@cache
+def document_comparison_prompt():
+    return _chat_prompt(DOCUMENT_COMPARISON_TEMPLATE)
+
+@cache
+def contextualize_question_prompt():
+    return _chat_prompt(CONTEXTUALIZE_QUESTION_TEMPLATE)
+
+@cache
+def context_qa_prompt():
+    return _chat_prompt(CONTEXT_QA_TEMPLATE)
+
+# Maps prompt names to cached factories; call the entry to get the ChatPromptTemplate
 PROMPT_REGISTRY = {
     "document_analysis"         :   document_analysis_prompt,
     "document_comparison"       :   document_comparison_prompt,
     "contextualize_question"    :   contextualize_question_prompt,
     "context_qa"                :   context_qa_prompt,
-}
\ No newline at end of file
+}
+
+# Precompiled string renderers for the same templates (see _compile_template)
+PROMPT_RENDERERS = {
+    "document_analysis"         :   _compile_template(DOCUMENT_ANALYSIS_TEMPLATE),
+    "document_comparison"       :   _compile_template(DOCUMENT_COMPARISON_TEMPLATE),
+    "contextualize_question"    :   _compile_template(CONTEXTUALIZE_QUESTION_TEMPLATE),
+    "context_qa"                :   _compile_template(CONTEXT_QA_TEMPLATE),
+}
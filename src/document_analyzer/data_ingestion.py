@@ -1,15 +1,27 @@
+import io
+import logging
 import os
 import fitz
-import uuid
 from datetime import datetime
 from logger.custom_logger import CustomLogger
 from exception.custom_exception import DocumentPortalException 
+from utils.file_copy import sendfile_copy, sendfile_source
+from utils.pdf_workers import PARALLEL_MIN_PAGES, discard_pdf_pool, extract_page_texts, get_pdf_pool, page_ranges
 import re
-from typing import Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import repeat
+from typing import Iterator, Optional, Tuple
 from pathlib import Path
 import shutil
 
+_logger = CustomLogger().get_logger(__name__)
+
 _SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9 _.\-()]+")
+# Deletes every allowed character: an empty result means the name needs no sanitizing
+_DELETE_SAFE_CHARS = str.maketrans("", "", "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789 _.-()")
 
 def _sanitize_filename(name: str) -> str:
     """
@@ -35,11 +47,18 @@ def _sanitize_filename(name: str) -> str:
     """
 
     # Extract just the filename part, removing any directory path
-    base = Path(name).name
+    base = name.rpartition("/")[2]
+    if base in ("", "."):
+        # Trailing "/" or "." component: let pathlib normalize it
+        base = Path(name).name
     
     # Replace unsafe characters with underscores for filesystem safety
-    # Prevents issues with special chars, Unicode, control characters
-    safe = _SAFE_NAME_RE.sub("_", base).strip()
+    # Prevents issues with special chars, Unicode, control characters.
+    # Typical upload names are already safe, so skip the regex for those.
+    if base.isascii() and not base.translate(_DELETE_SAFE_CHARS):
+        safe = base.strip()
+    else:
+        safe = _SAFE_NAME_RE.sub("_", base).strip()
 
     # Ensure PDF extension (since this handler is PDF-focused)
     if not safe.lower().endswith(".pdf"):
@@ -48,6 +67,72 @@ def _sanitize_filename(name: str) -> str:
     # Limit to 255 chars (filesystem limit on most systems)
     return safe[:255]
 
+# Chunk size for copying upload streams to disk
+_COPY_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# One reusable copy buffer per thread (concurrent uploads must not share it)
+_copy_buffers = threading.local()
+
+def _get_copy_buffer() -> bytearray:
+    """Return this thread's reusable upload copy buffer, allocating it on first use."""
+    buf = getattr(_copy_buffers, "buf", None)
+    if buf is None:
+        buf = _copy_buffers.buf = bytearray(_COPY_CHUNK_SIZE)
+    return buf
+
+# Per-write data sync flag: O_DSYNC where available (Linux, macOS), else O_SYNC
+_SYNC_OPEN_FLAG = getattr(os, "O_DSYNC", 0) or getattr(os, "O_SYNC", 0)
+
+def _open_durable(path: Path):
+    """
+    Open a new file for binary writing with synchronous data writes.
+
+    Each write() returns only once its data is on stable storage, so no
+    separate fsync() barrier (or tmp-file rename) is needed afterwards.
+    Falls back to a plain exclusive create where neither flag exists.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0) | _SYNC_OPEN_FLAG
+    return os.fdopen(os.open(path, flags, 0o644), "wb")
+
+# Plain-text extraction flags: PyMuPDF's defaults for "text" output (which
+# also keep CID codes for glyphs with no Unicode mapping), minus ligature
+# preservation we don't need for LLM input
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+
+# Upper bound on session directories removed concurrently during cleanup
+_RMTREE_WORKERS = 8
+
+def _extract_pages_parallel(pool: ProcessPoolExecutor, doc: fitz.Document, path: str,
+                            page_count: int, flags: int) -> Iterator[str]:
+    """
+    Extract text for the first page_count pages, split into contiguous ranges.
+
+    PyMuPDF is not thread-safe and holds the GIL during extraction, so pages
+    are fanned out to processes, each opening its own document handle.
+    Yields page texts in page order; closing the iterator early cancels
+    ranges that have not started yet. If the pool breaks, it is discarded
+    and the remaining pages are extracted inline from doc.
+    """
+    ranges = page_ranges(page_count)
+    results = None
+    done = 0
+    try:
+        # map() submits every range up front, so a pool that is already
+        # broken raises here rather than while iterating
+        results = pool.map(extract_page_texts, repeat(path), [start for start, _ in ranges],
+                           [stop for _, stop in ranges], repeat(flags))
+        for texts in results:
+            for text in texts:
+                yield text
+                done += 1
+    except BrokenProcessPool:
+        discard_pdf_pool(pool)
+        for page in doc.pages(done, page_count):
+            yield page.get_text('text', flags=flags)
+    finally:
+        if results is not None:
+            results.close()
+
 class DocumentHandler:
     """
     Production-safe document handler with session management.
@@ -63,17 +148,26 @@ class DocumentHandler:
 
     def __init__(self, 
                  data_dir: str =None,
-                 session_id: str=None) -> None:
+                 session_id: str=None,
+                 durable: bool=False) -> None:
         """
         Initialize document handler with session management.
         
         Args:
             data_dir (str): Base directory for document storage
             session_id (str, optional): Session identifier. Auto-generated if None.
+            durable (bool): fsync each saved document before it is renamed into
+                place. Off by default: session uploads are ephemeral, and the
+                atomic rename already guarantees readers never see a partial
+                file; fsync only adds crash durability at the cost of a
+                journal commit per upload.
         """
 
         try:
-            self.logger = CustomLogger().get_logger(__name__)
+            self.logger = _logger
+            self._fsync_on_save = durable
+            # Documents saved without fsync since the last checkpoint()
+            self._unsynced_paths = []
             # Get the path from env var: DATA_STORAGE_PATH or fallback to <cwd>/data/document_analysis
             # if env var is not configured.
             default_dir = os.getenv(
@@ -84,11 +178,13 @@ class DocumentHandler:
             self.data_dir = Path(data_dir or default_dir)
 
             # Generate unique session ID with timestamp and random component
-            self.session_id = session_id or f"session_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+            self.session_id = session_id or f"session_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{os.urandom(4).hex()}"
 
             # Create session-specific directory for file isolation
             self.session_path = self.data_dir / self.session_id
             self.session_path.mkdir(parents=True, exist_ok=True)
+            # Prefix of every path save_document() returns for this session
+            self._session_prefix = os.path.join(str(self.session_path), "")
 
             self.logger.info("Document Handler initialized successfully", 
                              session_id=self.session_id, 
@@ -120,13 +216,10 @@ class DocumentHandler:
             ValueError: If file is invalid, too large, or wrong format
         """
 
+        # Set once this call has created write_path; until then the path may
+        # belong to another upload (the durable O_EXCL open refuses to reuse it)
+        created = False
         try:
-            # Handle both bytes and file streams
-            if isinstance(file_stream, bytes):
-                # Convert bytes to BytesIO for consistent streaming interface
-                from io import BytesIO
-                file_stream = BytesIO(file_stream)
-
             self.logger.info(
                 "Starting document save process",
                 session_id=self.session_id,
@@ -142,74 +235,103 @@ class DocumentHandler:
                 raise DocumentPortalException(error_msg)
 
 
-            unique_name = f"{Path(clean_name).stem}_{uuid.uuid4().hex[:8]}.pdf"
+            # clean_name always ends in ".pdf", so slicing off 4 chars gives the stem
+            unique_name = f"{clean_name[:-4]}_{os.urandom(4).hex()}.pdf"
 
-            # Use atomic write pattern for reliability
+            # Default: atomic write pattern (tmp file + os.replace).
+            # Durable: stream straight to the final path with synchronous writes,
+            # avoiding the extra metadata commits of a tmp create + rename.
             file_path = self.session_path / unique_name
             temp_path = file_path.with_suffix('.tmp')
+            write_path = file_path if self._fsync_on_save else temp_path
             
-            self.logger.debug(
-                "File paths prepared",
-                session_id=self.session_id,
-                clean_name=clean_name,
-                unique_name=unique_name,
-                temp_path=str(temp_path),
-                final_path=str(file_path)
-            )
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(
+                    "File paths prepared",
+                    session_id=self.session_id,
+                    clean_name=clean_name,
+                    unique_name=unique_name,
+                    temp_path=str(temp_path),
+                    final_path=str(file_path)
+                )
 
-            # Stream file in chunks to avoid loading entire file in memory
-            chunk_size = 64 * 1024  # 64KB chunks
             total_size = 0
             max_size_bytes = max_size_mb * 1024 * 1024
-            pdf_header_checked = False
 
-            with open(temp_path, 'wb') as f:
-                while True:
-                    chunk = file_stream.read(chunk_size)
-                    if not chunk:
-                        break
-
-                    # Check size limit incrementally
-                    total_size += len(chunk)
+            out = _open_durable(write_path) if self._fsync_on_save else open(write_path, 'wb')
+            created = True
+            with out as f:
+                if isinstance(file_stream, (bytes, bytearray, memoryview)):
+                    # In-memory payload (the common upload case): validate once and
+                    # write it with a single call, no BytesIO wrapper or chunk loop
+                    data = memoryview(file_stream)
+                    total_size = data.nbytes
                     if total_size > max_size_bytes:
-                        error_msg = f"File too large. Max {max_size_mb}MB allowed, got {total_size / (1024*1024):.1f}MB"
-                        self.logger.error(error_msg, session_id=self.session_id, total_size=total_size)
-                        raise DocumentPortalException(error_msg)
-
-                    # Validate PDF magic header on first chunk
-                    if not pdf_header_checked:
-                        if not chunk.startswith(b'%PDF-'):
-                            error_msg = "File content is not a valid PDF"
-                            self.logger.error(error_msg, session_id=self.session_id, file_name=file_name)
-                            raise DocumentPortalException(error_msg)
-                        pdf_header_checked = True
-                        self.logger.debug("PDF header validation passed", session_id=self.session_id)
-
-                    # Write chunk to disk
-                    f.write(chunk)
-
-                # Ensure all data is written to disk
+                        self._reject_too_large(total_size, max_size_mb)
+
+                    if data[:5] != b'%PDF-':
+                        self._reject_not_pdf(file_name)
+                    self.logger.debug("PDF header validation passed", session_id=self.session_id)
+
+                    f.write(data)
+                elif (source := sendfile_source(file_stream)) is not None and (
+                        copied := self._copy_with_sendfile(file_stream, source, f, max_size_bytes, max_size_mb, file_name)) is not None:
+                    total_size = copied
+                else:
+                    # Stream file in chunks to avoid loading entire file in memory;
+                    # 1MB chunks keep the number of write() calls low, and streams
+                    # supporting readinto() fill a reused buffer instead of
+                    # allocating a new bytes object per chunk
+                    readinto = getattr(file_stream, "readinto", None)
+                    if readinto is not None:
+                        buf_view = memoryview(_get_copy_buffer())
+                        def read_chunk():
+                            return buf_view[:readinto(buf_view) or 0]
+                    else:
+                        def read_chunk():
+                            return file_stream.read(_COPY_CHUNK_SIZE)
+
+                    # Validate PDF magic header once, on the first chunk
+                    chunk = read_chunk()
+                    if chunk and chunk[:5] != b'%PDF-':
+                        self._reject_not_pdf(file_name)
+                    self.logger.debug("PDF header validation passed", session_id=self.session_id)
+
+                    # Tight copy loop: read -> size check -> write
+                    while chunk:
+                        total_size += len(chunk)
+                        if total_size > max_size_bytes:
+                            self._reject_too_large(total_size, max_size_mb)
+                        f.write(chunk)
+                        chunk = read_chunk()
+
+                # Hand userspace buffers to the OS before the rename / return
                 f.flush()
-                os.fsync(f.fileno())
+                if self._fsync_on_save and not _SYNC_OPEN_FLAG:
+                    # No synchronous-write flag on this platform
+                    os.fsync(f.fileno())
 
-            # Atomic move to final location (prevents partial writes)
-            os.replace(temp_path, file_path)
+            if not self._fsync_on_save:
+                # Atomic move to final location (prevents partial writes)
+                os.replace(temp_path, file_path)
+                # Durability is deferred to a batched checkpoint()
+                self._unsynced_paths.append(file_path)
 
             self.logger.info(
                 "Document saved successfully",
                 session_id=self.session_id,
                 file_name=file_name,
                 saved_path=str(file_path),
-                file_size_bytes=total_size,
-                file_size_mb=f"{total_size / (1024*1024):.2f}"
+                file_size_bytes=total_size
             )
             
             return str(file_path)
 
         except Exception as e:
-            # Clean up temporary file on any error
-            if 'temp_path' in locals() and temp_path.exists():
-                temp_path.unlink()
+            # Clean up the partially written file (tmp or durable target) on any
+            # error, but never a file this call did not create
+            if created and write_path.exists():
+                write_path.unlink()
             
             error_msg = f"Error saving document: {e}"
             self.logger.error(error_msg, 
@@ -218,25 +340,175 @@ class DocumentHandler:
                               error=str(e))
             raise DocumentPortalException(error_msg) from e
 
+    def _reject_too_large(self, total_size: int, max_size_mb: int) -> None:
+        """Log (with raw byte counts) and raise for an upload over the size limit."""
+        self.logger.error("File too large", session_id=self.session_id,
+                          total_size=total_size, max_size_mb=max_size_mb)
+        raise DocumentPortalException(
+            f"File too large. Max {max_size_mb}MB allowed, got {total_size / (1024*1024):.1f}MB"
+        )
+
+    def _reject_not_pdf(self, file_name: str) -> None:
+        """Log and raise for an upload without a PDF magic header."""
+        error_msg = "File content is not a valid PDF"
+        self.logger.error(error_msg, session_id=self.session_id, file_name=file_name)
+        raise DocumentPortalException(error_msg)
+
+    def _copy_with_sendfile(self, file_stream, source: tuple, f, max_size_bytes: int, max_size_mb: int, file_name: str) -> Optional[int]:
+        """
+        Copy a file-backed upload into f with os.sendfile (no userspace buffer).
+
+        Size and PDF header are validated up front from fstat()/pread(), so
+        nothing is written for a rejected file.
+
+        Returns:
+            Optional[int]: Bytes copied, or None if the kernel cannot sendfile
+            between these descriptors (caller falls back to the chunk loop)
+        """
+        src_fd, offset = source
+        total_size = max(os.fstat(src_fd).st_size - offset, 0)
+        if total_size > max_size_bytes:
+            self._reject_too_large(total_size, max_size_mb)
+
+        if os.pread(src_fd, 5, offset) != b'%PDF-':
+            self._reject_not_pdf(file_name)
+        self.logger.debug("PDF header validation passed", session_id=self.session_id)
+
+        copied = sendfile_copy(src_fd, f.fileno(), offset, total_size)
+        if copied is None:
+            return None
+
+        # Leave the source stream positioned after the copied bytes, as read() would
+        file_stream.seek(offset + copied)
+        return copied
+
+    def checkpoint(self) -> None:
+        """
+        Flush every document saved in this session to stable storage in one batch.
+
+        Call after a batch of save_document() calls when the uploads must
+        survive a crash. Each pending file is fsync'd once, then the session
+        directory itself, so the renamed directory entries are persisted too.
+        This replaces N per-save fsync barriers with a single checkpoint.
+
+        Raises:
+            DocumentPortalException: If any file or the directory cannot be synced
+        """
+        try:
+            pending = len(self._unsynced_paths)
+            for path in self._unsynced_paths:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            self._unsynced_paths.clear()
+
+            dir_fd = os.open(self.session_path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+            self.logger.info("Session checkpoint completed",
+                             session_id=self.session_id,
+                             files_synced=pending)
+
+        except Exception as e:
+            self.logger.error("Session checkpoint failed", session_id=self.session_id, error=str(e))
+            raise DocumentPortalException(e) from e
+
+    def read_document_stream(self,
+                             file_path: str,
+                             max_pages: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily yield the text of a document one page at a time.
+
+        Lets callers (chunkers, embedders) consume pages with a constant memory
+        footprint instead of materializing the whole document as one string.
+        Pages are only extracted as they are consumed; closing the generator
+        early stops extraction.
+
+        Args:
+            file_path (str): Absolute path to document file
+            max_pages (int, optional): Limit number of pages to process (for large PDFs)
+
+        Yields:
+            Tuple[int, str]: 1-based page number and that page's plain text
+
+        Raises:
+            DocumentPortalException: If file cannot be read or processed
+        """
+        try:
+            # Paths save_document() built inside this session need no
+            # validation (fitz.open reports a missing file itself), so skip the
+            # per-component resolve; anything else is resolved and checked
+            # with a single stat
+            path = os.fspath(file_path)
+            if not (path.startswith(self._session_prefix) and ".." not in path):
+                path = os.path.realpath(path)
+                os.stat(path)
+
+            self.logger.debug(
+                "File path resolved",
+                session_id=self.session_id,
+                resolved_path=path
+            )
+
+            with fitz.open(path) as doc:
+                total_pages = len(doc)
+                pages_to_process = min(max_pages or total_pages, total_pages)
+
+                self.logger.debug(
+                    "PDF document opened",
+                    session_id=self.session_id,
+                    total_pages=total_pages,
+                    pages_to_process=pages_to_process
+                )
+
+                # get_pdf_pool() is None on single-CPU hosts: extract inline
+                pool = get_pdf_pool() if pages_to_process >= PARALLEL_MIN_PAGES else None
+                if pool is not None:
+                    page_texts = _extract_pages_parallel(pool, doc, path, pages_to_process, _TEXT_FLAGS)
+                else:
+                    # Iterate pages directly (one Python/C crossing per page)
+                    page_texts = (page.get_text('text', flags=_TEXT_FLAGS)
+                                  for page in doc.pages(0, pages_to_process))
+
+                try:
+                    yield from enumerate(page_texts, 1)
+                finally:
+                    # Also cancels any worker ranges not yet started
+                    page_texts.close()
+
+        except Exception as e:
+            error_msg = f"Error reading document: {e}"
+            self.logger.error(error_msg, session_id=self.session_id, file_path=file_path, error=str(e))
+            raise DocumentPortalException(error_msg) from e
+
     def read_document(self,
                       file_path: str,
-                      max_pages: Optional[int] = None) -> str:
+                      max_pages: Optional[int] = None,
+                      max_chars: int = 1024 * 1024) -> str:
         """
         Extract text content from a document file using memory efficient streaming
         
         Currently supports PDF text extraction. Designed for extension
-        to other document formats.
+        to other document formats. Joins read_document_stream() pages
+        with page markers.
         
         Args:
             file_path (str): Absolute path to document file
             max_pages (int, optional): Limit number of pages to process (for large PDFs)
+            max_chars (int): Text budget; extraction stops before the first page
+                that would exceed it, and no further pages are extracted
 
             
         Returns:
             str: Extracted text content with page markers
             
         Raises:
-            ValueError: If file cannot be read or processed
+            DocumentPortalException: If file cannot be read or processed
         """
         try:
 
@@ -247,79 +519,56 @@ class DocumentHandler:
                 max_pages=max_pages
             )
 
-            # Resolve path and ensure it exists
-            path = Path(file_path).resolve(strict=True)
-
-            self.logger.debug(
-                "File path resolved",
-                session_id=self.session_id,
-                resolved_path=str(path)
-            )
-
-            # Use generator-based approach for memory efficiency
-            def extract_text_generator():
-                with fitz.open(path) as doc:
-                    total_pages = len(doc)
-                    pages_to_process = min(max_pages or total_pages, total_pages)
-
-                    self.logger.debug(
-                        "PDF document opened",
-                        session_id=self.session_id,
-                        total_pages=total_pages,
-                        pages_to_process=pages_to_process
-                    )
-
-                    for page_num in range(pages_to_process):
-                        page = doc[page_num]
-                        yield f"\n--- Page {page_num + 1} ---\n"
-                        yield page.get_text()
-                        yield "\n"
-                        
-                        # Clear page from memory after processing
-                        page = None
-
-
-            # Build text in chunks to avoid large string concatenations
-            text_chunks = []
-            chunk_size = 0
-            max_chunk_size = 1024 * 1024  # 1MB text chunks
-            
+            # Accumulate into a single C-backed buffer instead of a list + join
+            buf = io.StringIO()
+            remaining = max_chars
+
+            # Page markers are emitted here, in page order. Pages are pulled
+            # lazily, so nothing past the budget is extracted.
+            pages = self.read_document_stream(file_path, max_pages)
+            try:
+                for page_num, page_text in pages:
+                    text_piece = f"\n--- Page {page_num} ---\n{page_text}\n"
+
+                    # Stop BEFORE adding the page that would exceed the budget
+                    if len(text_piece) > remaining:
+                        self.logger.warning(
+                            "Text extraction stopped due to size limit",
+                            session_id=self.session_id,
+                            stopped_at_page=page_num,
+                            current_chars=max_chars - remaining,
+                            page_chars=len(text_piece),
+                            max_chars=max_chars
+                        )
+                        break
 
-            for text_piece in extract_text_generator():
-                # Check if adding this piece would exceed the limit
-                if chunk_size + len(text_piece) > max_chunk_size:
-                    self.logger.warning(
-                        "Text extraction stopped due to size limit",
-                        session_id=self.session_id,
-                        current_chunk_size_mb=f"{chunk_size / (1024*1024):.2f}",
-                        would_be_size_mb=f"{(chunk_size + len(text_piece)) / (1024*1024):.2f}",
-                        max_chunk_size_mb=f"{max_chunk_size / (1024*1024):.2f}"
-                    )
-                    break  # Stop BEFORE adding the piece that would exceed limit
-
-                # Safe to add - won't exceed limit
-                text_chunks.append(text_piece)
-                chunk_size += len(text_piece)
+                    buf.write(text_piece)
+                    remaining -= len(text_piece)
+                    if not remaining:
+                        # Budget exactly filled; don't extract another page
+                        break
+            finally:
+                pages.close()
 
-            
-            extracted_text = ''.join(text_chunks)
+            extracted_text = buf.getvalue()
 
             self.logger.info(
                 "Document read successfully",
                 session_id=self.session_id,
                 file_path=file_path,
-                text_length=len(extracted_text),
-                text_size_kb=f"{len(extracted_text) / 1024:.1f}"
+                text_length=len(extracted_text)
             )
             
             return extracted_text
 
+        except DocumentPortalException:
+            # Already logged and wrapped by read_document_stream
+            raise
         except Exception as e:
             error_msg = f"Error reading document: {e}"
             self.logger.error(error_msg, session_id=self.session_id, file_path=file_path, error=str(e))
             raise DocumentPortalException(error_msg) from e
 
-
     def cleanup_old_sessions(self, keep_latest: int = 3):
         """
         Remove old session directories while keeping the most recent ones.
@@ -332,7 +581,7 @@ class DocumentHandler:
         try:
             # Validate input to prevent accidental deletion of all sessions
             if keep_latest < 1:
-                self.logger.warning(f"Invalid keep_latest value: {keep_latest}, using default of 3")
+                self.logger.warning("Invalid keep_latest value, using default of 3", keep_latest=keep_latest)
                 keep_latest = 3
             
             self.logger.info(
@@ -347,26 +596,32 @@ class DocumentHandler:
                 return
 
             # Get all session directories and sort by creation time (newest first)
-            # Using creation time ensures we keep the most recently created sessions
-            sessions = sorted(
-                [f for f in self.data_dir.iterdir() if f.is_dir()], 
-                key=lambda x: x.stat().st_ctime,  # Sort by creation time
-                reverse=True  # Most recent first
-            )
-            self.logger.info(f"Found {len(sessions)} session directories")
+            # Using creation time ensures we keep the most recently created sessions.
+            # scandir's d_type answers is_dir() without a stat per entry; symlinks
+            # are never treated as sessions.
+            with os.scandir(self.data_dir) as entries:
+                sessions = [(entry.stat().st_ctime, entry.path)
+                            for entry in entries if entry.is_dir(follow_symlinks=False)]
+            sessions.sort(reverse=True)  # Most recent first
+            self.logger.info("Found session directories", count=len(sessions))
 
             # Delete old session directories
-            for folder in sessions[keep_latest:]:
-                # Use shutil.rmtree for efficient directory deletion
-                # ignore_errors=True ensures individual file permission issues 
+            old_folders = [folder for _, folder in sessions[keep_latest:]]
+            if old_folders:
+                # rmtree is a long run of unlink/rmdir syscalls that release the
+                # GIL, so independent session trees are removed concurrently.
+                # ignore_errors=True ensures individual file permission issues
                 # don't stop the entire cleanup process
-                shutil.rmtree(folder, ignore_errors=True)
+                remove_tree = partial(shutil.rmtree, ignore_errors=True)
+                with ThreadPoolExecutor(max_workers=min(_RMTREE_WORKERS, len(old_folders))) as pool:
+                    list(pool.map(remove_tree, old_folders))
 
+            for folder in old_folders:
                 # Verify deletion was successful
-                if not folder.exists():
-                    self.logger.info("Old session folder deleted", path=str(folder))
+                if not os.path.lexists(folder):
+                    self.logger.info("Old session folder deleted", path=folder)
                 else:
-                    self.logger.warning("Failed to completely delete session", path=str(folder))
+                    self.logger.warning("Failed to completely delete session", path=folder)
 
         except Exception as e:
             self.logger.error("Error cleaning old sessions", error=str(e))
@@ -1,13 +1,106 @@
 from pathlib import Path
-import fitz
+import io
+import logging
 from logger.custom_logger import CustomLogger
 from exception.custom_exception import DocumentPortalException
-from typing import Tuple, Optional, List
+from utils.config_loader import load_config
+from utils.file_copy import sendfile_copy, sendfile_source
+from utils.pdf_backend import get_pdf_backend
+from utils.pdf_workers import discard_pdf_pool, extract_pdf_text, get_pdf_pool
+from typing import Callable, Tuple, Optional
 import os
+import stat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import partial
+from collections import OrderedDict
+import threading
 import uuid
 import shutil
 
+_logger = CustomLogger().get_logger(__name__)
+
+def _write_bytes(path: Path, data) -> int:
+    """
+    Write a bytes-like object to path with unbuffered os.write calls.
+
+    Skips the BufferedWriter layer (and its copy) of open(..., "wb"); loops
+    because os.write may write fewer bytes than requested.
+
+    Returns:
+        int: Number of bytes written
+    """
+    view = memoryview(data).cast("B")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        written = 0
+        while written < len(view):
+            written += os.write(fd, view[written:])
+        return written
+    finally:
+        os.close(fd)
+
+def _write_upload(path: Path, upload) -> int:
+    """
+    Write an uploaded file to path.
+
+    File-backed uploads are copied with os.sendfile() entirely in kernel
+    space, from their current position; anything else (including spooled
+    uploads still held in memory) goes through the upload's get_buffer().
+
+    Returns:
+        int: Number of bytes written
+    """
+    source = sendfile_source(upload)
+    if source is not None:
+        src_fd, offset = source
+        count = max(os.fstat(src_fd).st_size - offset, 0)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            written = sendfile_copy(src_fd, fd, offset, count)
+        finally:
+            os.close(fd)
+        if written is not None:
+            # Leave the upload positioned after the copied bytes, as read() would
+            upload.seek(offset + written)
+            return written
+    # get_buffer() rewrites the file from scratch (O_TRUNC)
+    return _write_bytes(path, upload.get_buffer())
+
+# Default storage root, resolved once at import rather than per instance
+_DEFAULT_BASE_DIR = (Path.cwd() / "data" / "document_compare").resolve()
+
+# Upper bound on session directories removed concurrently during cleanup
+_RMTREE_WORKERS = 8
+
+# combine_documents only hands files to worker processes when there is at least
+# this much PDF data in total; smaller sessions finish faster read inline than
+# the pool's task dispatch and result pickling take
+_PARALLEL_MIN_BYTES = 1024 * 1024
+
+# Extracted text of recently read PDFs, keyed by (backend, path, mtime_ns, size)
+# so a file replaced on disk is re-extracted; shared by all instances
+_PDF_TEXT_CACHE_SIZE = 32
+_pdf_text_cache: "OrderedDict[Tuple[str, str, int, int], Tuple[str, int, int]]" = OrderedDict()
+_pdf_text_cache_lock = threading.Lock()
+
+def _cache_get(key: Tuple[str, str, int, int]) -> Optional[Tuple[str, int, int]]:
+    """Return a cached extraction and mark it most recently used, or None."""
+    with _pdf_text_cache_lock:
+        result = _pdf_text_cache.get(key)
+        if result is not None:
+            _pdf_text_cache.move_to_end(key)
+        return result
+
+def _cache_put(key: Tuple[str, str, int, int], result: Tuple[str, int, int]) -> None:
+    """Store an extraction, evicting the least recently used beyond the bound."""
+    with _pdf_text_cache_lock:
+        _pdf_text_cache[key] = result
+        _pdf_text_cache.move_to_end(key)
+        if len(_pdf_text_cache) > _PDF_TEXT_CACHE_SIZE:
+            _pdf_text_cache.popitem(last=False)
+
 class DocumentIngestion:
     """
     Handles document ingestion operations including file management and PDF text extraction.
@@ -19,12 +112,22 @@ class DocumentIngestion:
     - Validating file types and handling errors gracefully
     """
     def __init__(self, 
-                 base_dir:str="./data/document_compare",
-                 session_id: str=None):
+                 base_dir:str=None,
+                 session_id: str=None,
+                 pdf_backend: Optional[str]=None):
 
-        self.logger = CustomLogger().get_logger(__name__)
+        self.logger = _logger
         try:
-            self.base_dir = Path(os.getcwd()) / base_dir
+            # PDF extractor: explicit argument, else config "pdf_backend", else fitz
+            self._backend = get_pdf_backend(pdf_backend or self._configured_backend())
+
+            # Defaults to <cwd at import>/data/document_compare; relative paths
+            # are taken from the current directory (getcwd only for those)
+            if base_dir is None:
+                self.base_dir = _DEFAULT_BASE_DIR
+            else:
+                base_path = Path(base_dir)
+                self.base_dir = base_path if base_path.is_absolute() else Path.cwd() / base_path
 
             # Generate unique session ID with timestamp and random component
             self.session_id = session_id or f"session_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
@@ -32,11 +135,13 @@ class DocumentIngestion:
             # Create session-specific directory for file isolation
             self.session_path = self.base_dir / self.session_id
             self.session_path.mkdir(parents=True, exist_ok=True)
+            # String form reused by scandir and log/error messages
+            self._session_dir = str(self.session_path)
 
             self.logger.info("DocumentIngestion initialized successfully", 
                              base_directory = str(self.base_dir),
                              session_id=self.session_id, 
-                             session_path=str(self.session_path))
+                             session_path=self._session_dir)
 
         except Exception as e:
             error_msg = f"Error while initializing DocumentIngestion: {str(e)}"
@@ -98,7 +203,9 @@ class DocumentIngestion:
         
         Args:
             ref_file: Reference file object with .name and .get_buffer() methods
+                (and optionally .fileno(), for file-backed uploads)
             actual_file: Actual file object with .name and .get_buffer() methods
+                (and optionally .fileno(), for file-backed uploads)
             
         Returns:
             Tuple[Path, Path]: Paths to saved reference and actual files
@@ -124,17 +231,12 @@ class DocumentIngestion:
             if ref_path == actual_path:
                 raise ValueError("Reference and actual files cannot have the same name")
 
-            # Save reference file
-            with open(ref_path, "wb") as f:
-                f.write(ref_file.get_buffer())
-
-            # Save actual file
-            with open(actual_path, "wb") as f:
-                f.write(actual_file.get_buffer())
+            # Save reference and actual files; the byte counts written double
+            # as the file sizes, so no stat is needed afterwards
+            ref_size = _write_upload(ref_path, ref_file)
+            actual_size = _write_upload(actual_path, actual_file)
 
             # Log successful saves with file sizes for monitoring
-            ref_size = ref_path.stat().st_size
-            actual_size = actual_path.stat().st_size
             
             self.logger.info("Files saved successfully", 
                            extra={
@@ -155,7 +257,8 @@ class DocumentIngestion:
 
     def read_pdf(self, pdf_path: Path) -> str:
         """
-        Extract text content from a PDF file using PyMuPDF (fitz).
+        Extract text content from a PDF file using the configured backend
+        (PyMuPDF by default, see utils.pdf_backend).
         
         Reads all pages from the PDF and combines them into a single text string
         with page separators. Handles encrypted PDFs and empty pages gracefully.
@@ -171,100 +274,121 @@ class DocumentIngestion:
             DocumentPortalException: If PDF reading fails due to file issues or corruption
         """
 
-        # Validate input path
-        if not pdf_path.exists():
+        # Validate input path with a single stat (exists + is_file would stat twice)
+        try:
+            pdf_stat = os.stat(pdf_path)
+        except (FileNotFoundError, NotADirectoryError):
             error_msg = f"PDF file does not exist: {pdf_path}"
             self.logger.error(error_msg)
             raise ValueError(error_msg)
             
-        if not pdf_path.is_file():
+        if not stat.S_ISREG(pdf_stat.st_mode):
             error_msg = f"Path is not a file: {pdf_path}"
             self.logger.error(error_msg)
             raise ValueError(error_msg)
         try:
-
-            # Open PDF document using PyMuPDF's context manager
-            # This ensures proper resource cleanup even if errors occur
-            with fitz.open(pdf_path) as doc:
-                # Check if PDF is encrypted before attempting to read
-                # Encrypted PDFs require passwords which we don't handle here
-                if doc.is_encrypted:
-                    error_msg = f"PDF is encrypted: {pdf_path.name}"
-                    self.logger.error(error_msg)
-                    raise ValueError(error_msg)
-
-                # Validate that the document has pages
-                if doc.page_count == 0:
-                    error_msg = f"PDF has no pages: {pdf_path.name}"
-                    self.logger.warning(error_msg)
-                    return ""
-                
-                # Initialize list to store text content from each page
-                page_texts = []
-
-                self.logger.info(f"Starting PDF text extraction from {pdf_path}", 
-                           extra={"total_pages": doc.page_count})
-
-                # Iterate through all pages in the document
-                for page_num in range(doc.page_count):
-                    # Load individual page object
-                    page = doc.load_page(page_num)
-                    # Extract text content from the page
-                    page_text = page.get_text()
-
-                    # Only include pages that contain actual text content
-                    # This skips empty pages or pages with only images
-                    if page_text and page_text.strip():
-                        # Add page separator with page number for document structure
-                        formatted_page = f"\n--- Page {page_num + 1} ---\n{page_text}"
-                        page_texts.append(formatted_page)
-                        
-                        self.logger.debug(f"Extracted text from page {page_num + 1}", 
-                                        extra={"page_text_length": len(page_text)})
-                
-                total_pages = doc.page_count
-
-            # Combine all page texts into a single string
-            combined_text = "\n".join(page_texts)
+            # Cached per (backend, path, mtime, size): re-reading an unchanged file is free
+            cache_key = self._text_cache_key(pdf_path, pdf_stat)
+            cached = _cache_get(cache_key)
+            if cached is None:
+                cached = extract_pdf_text(pdf_path, self._backend, get_pdf_pool())
+                _cache_put(cache_key, cached)
+            combined_text, total_pages, pages_with_text = cached
+
+            # Validate that the document has pages
+            if total_pages == 0:
+                error_msg = f"PDF has no pages: {pdf_path.name}"
+                self.logger.warning(error_msg)
+                return ""
             
             self.logger.info(f"PDF text extraction completed successfully", 
                            extra={
                                "total_pages": total_pages,
-                               "pages_with_text": len(page_texts),
+                               "pages_with_text": pages_with_text,
                                "total_text_length": len(combined_text)
                            })
             
             return combined_text
-        except ValueError:
-            # Re-raise ValueError (encrypted PDF, file not found) without wrapping
+        except ValueError as e:
+            # Re-raise ValueError (encrypted PDF) without wrapping
+            self.logger.error(str(e))
             raise
         except Exception as e:
             error_msg = f"Error while reading PDF '{pdf_path.name}': {str(e)}"
             self.logger.error(error_msg, extra={"pdf_path": str(pdf_path)})
             raise DocumentPortalException(error_msg)
-        
+
+    def read_pdf_bytes(self, data: bytes, name: str = "<memory>") -> str:
+        """
+        Extract text content from an in-memory PDF, e.g. an upload buffer.
+
+        Same output as read_pdf, but parses the bytes directly instead of
+        requiring them to be written to disk and re-read first. Results are
+        not cached (there is no path/mtime to key them by).
+
+        Args:
+            data (bytes): Raw PDF file content
+            name (str): Display name for log and error messages
+
+        Returns:
+            str: Combined text content from all pages with page markers
+
+        Raises:
+            ValueError: If the PDF is encrypted
+            DocumentPortalException: If PDF parsing fails
+        """
+        try:
+            # Always inline: a pool would pickle the whole buffer into every
+            # page-range task, costing more IPC than the extraction saves
+            combined_text, total_pages, pages_with_text = extract_pdf_text(data, self._backend)
+
+            # Validate that the document has pages
+            if total_pages == 0:
+                self.logger.warning(f"PDF has no pages: {name}")
+                return ""
+
+            self.logger.info("PDF text extraction completed successfully",
+                           extra={
+                               "pdf_name": name,
+                               "total_pages": total_pages,
+                               "pages_with_text": pages_with_text,
+                               "total_text_length": len(combined_text)
+                           })
+
+            return combined_text
+        except ValueError as e:
+            # Re-raise ValueError (encrypted PDF) without wrapping
+            self.logger.error(str(e), pdf_name=name)
+            raise
+        except Exception as e:
+            error_msg = f"Error while reading PDF '{name}': {str(e)}"
+            self.logger.error(error_msg)
+            raise DocumentPortalException(error_msg)
 
     def combine_documents(self)-> str:
         try:
             # Check if session directory exists
             if not self.session_path.exists():
-                error_msg = f"Session directory does not exist: {self.session_path}"
+                error_msg = f"Session directory does not exist: {self._session_dir}"
                 self.logger.error(error_msg)
                 raise DocumentPortalException(error_msg)
             
-            self.logger.info(f"Starting document combination from directory: {self.session_path}")
-
-            # Dictionary to store document contents with metadata
-            doc_contents_dict = {}
-
-            # Get all PDF files in the directory (case-insensitive)
-            pdf_files = sorted(
-                [f for f in self.session_path.iterdir() 
-                if f.is_file() and f.name.lower().endswith(".pdf")]
-            )
+            self.logger.info(f"Starting document combination from directory: {self._session_dir}")
+
+            # Combined output is written in a single pass as each file is read
+            combined = io.StringIO()
+
+            # Get all PDF files in the directory (case-insensitive); one scandir
+            # pass answers is_file() from the directory entry, without a stat each
+            with os.scandir(self._session_dir) as entries:
+                pdf_entries = sorted(
+                    (Path(entry.path), entry.stat().st_size) for entry in entries
+                    if entry.is_file() and entry.name.lower().endswith(".pdf")
+                )
+            pdf_files = [pdf_file for pdf_file, _ in pdf_entries]
             
             if not pdf_files:
-                warning_msg = f"No PDF files found in directory: {self.session_path}"
+                warning_msg = f"No PDF files found in directory: {self._session_dir}"
                 self.logger.warning(warning_msg)
                 return ""  # Return empty string instead of raising exception
             
@@ -274,29 +398,39 @@ class DocumentIngestion:
             successful_reads = 0
             failed_reads = 0
             
-            for pdf_file in pdf_files:
+            # PDFs are independent, so read them in parallel worker processes
+            # (PyMuPDF is neither thread-safe nor GIL-releasing); files already
+            # extracted by read_pdf come from the text cache. A single file, a
+            # session below _PARALLEL_MIN_BYTES, or a host without a pool (one
+            # CPU) is read inline
+            total_bytes = sum(size for _, size in pdf_entries)
+            pool = None
+            if len(pdf_files) > 1 and total_bytes >= _PARALLEL_MIN_BYTES:
+                pool = get_pdf_pool()
+            if pool is not None:
+                readers = [self._cached_reader(pdf_file, pool) for pdf_file in pdf_files]
+            else:
+                readers = [partial(self.read_pdf, pdf_file) for pdf_file in pdf_files]
+
+            for pdf_file, read_text in zip(pdf_files, readers):
                 try:
                     self.logger.info(f"Processing file: {pdf_file}")
                     
-                    # Extract text content from PDF
-                    doc_content = self.read_pdf(pdf_file)
+                    # Extract text content from PDF (re-raises worker errors)
+                    doc_content = read_text()
                     
                     # Only include documents with content
-                    if doc_content and doc_content.strip():
-                        # Store content with optional metadata
-                        file_info = {
-                            'content': doc_content,
-                            'file_size': pdf_file.stat().st_size,
-                            'char_count': len(doc_content)
-                        }
-                        doc_contents_dict[pdf_file.name] = file_info
+                    if doc_content and not doc_content.isspace():
+                        # Documents are separated by a blank line
+                        if successful_reads:
+                            combined.write("\n\n")
+                        combined.write(f"Document: {pdf_file.name}\n")
+                        combined.write(doc_content)
                         successful_reads += 1
                         
-                        self.logger.debug(f"Successfully processed {pdf_file.name}", 
-                                        extra={
-                                            "file_size": file_info['file_size'],
-                                            "char_count": file_info['char_count']
-                                        })
+                        if self.logger.is_enabled_for(logging.DEBUG):
+                            self.logger.debug(f"Successfully processed {pdf_file.name}",
+                                              extra={"char_count": len(doc_content)})
                     else:
                         self.logger.warning(f"No content extracted from {pdf_file.name}")
                         failed_reads += 1
@@ -314,18 +448,13 @@ class DocumentIngestion:
                     continue
 
             # Check if any documents were successfully processed
-            if not doc_contents_dict:
+            if not successful_reads:
                 error_msg = f"No documents could be processed successfully. Failed: {failed_reads}"
                 self.logger.error(error_msg)
                 raise DocumentPortalException(error_msg)
 
-            doc_parts = []
-            
-            for doc_name, doc_info in doc_contents_dict.items():
-                doc_parts.append(f"Document: {doc_name}\n{doc_info['content']}")
-
-            combined_text = "\n\n".join(doc_parts)
-            self.logger.info("Documents combined successfully", count=len(doc_parts))
+            combined_text = combined.getvalue()
+            self.logger.info("Documents combined successfully", count=successful_reads)
             return combined_text
         except DocumentPortalException:
             # Re-raise DocumentPortalException without wrapping
@@ -334,10 +463,49 @@ class DocumentIngestion:
         except Exception as e:
             # Handle unexpected errors
             error_msg = f"Unexpected error while combining documents: {str(e)}"
-            self.logger.error(error_msg, extra={"Session Dir": str(self.session_path)})
+            self.logger.error(error_msg, extra={"Session Dir": self._session_dir})
             raise DocumentPortalException(error_msg)
         
 
+    def _text_cache_key(self, pdf_path: Path, pdf_stat: os.stat_result) -> Tuple[str, str, int, int]:
+        """Text cache key: a file replaced on disk, or read with another backend, misses."""
+        return (self._backend.name, str(pdf_path), pdf_stat.st_mtime_ns, pdf_stat.st_size)
+
+    def _cached_reader(self, pdf_path: Path, pool: ProcessPoolExecutor) -> Callable[[], str]:
+        """
+        Reader for one file of combine_documents: its cached text, or the
+        result of a worker extraction submitted now, which fills the cache.
+        """
+        try:
+            cache_key = self._text_cache_key(pdf_path, os.stat(pdf_path))
+        except OSError:
+            # read_pdf reports the missing file with its usual error
+            return partial(self.read_pdf, pdf_path)
+
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return lambda: cached[0]
+
+        future = pool.submit(extract_pdf_text, pdf_path, self._backend)
+        def read_text() -> str:
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                # A worker died; later calls get a fresh pool, this file is read inline
+                discard_pdf_pool(pool)
+                return self.read_pdf(pdf_path)
+            _cache_put(cache_key, result)
+            return result[0]
+        return read_text
+
+    @staticmethod
+    def _configured_backend() -> Optional[str]:
+        """The "pdf_backend" config value, or None if unset or no config file is reachable."""
+        try:
+            return (load_config() or {}).get("pdf_backend")
+        except OSError:
+            return None
+
     def cleanup_old_sessions(self, keep_latest: int = 3):
         """
         Remove old session directories while keeping the most recent ones.
@@ -365,26 +533,35 @@ class DocumentIngestion:
                 return
 
             # Get all session directories and sort by creation time (newest first)
-            # Using creation time ensures we keep the most recently created sessions
-            sessions = sorted(
-                [f for f in self.base_dir.iterdir() if f.is_dir()], 
-                key=lambda x: x.stat().st_ctime,  # Sort by creation time
-                reverse=True  # Most recent first
-            )
-            self.logger.info(f"Found {len(sessions)} session directories")
+            # Using creation time ensures we keep the most recently created sessions.
+            # scandir's d_type answers is_dir() without a stat per entry.
+            with os.scandir(self.base_dir) as entries:
+                sessions = [(entry.stat().st_ctime, entry.path)
+                            for entry in entries if entry.is_dir(follow_symlinks=False)]
+            sessions.sort(reverse=True)  # Most recent first
+            self.logger.info("Found session directories", count=len(sessions))
 
             # Delete old session directories
-            for folder in sessions[keep_latest:]:
-                # Use shutil.rmtree for efficient directory deletion
-                # ignore_errors=True ensures individual file permission issues 
+            if len(sessions) > keep_latest:
+                # Drop cached extractions rather than pin text of deleted files
+                with _pdf_text_cache_lock:
+                    _pdf_text_cache.clear()
+            old_folders = [folder for _, folder in sessions[keep_latest:]]
+            if old_folders:
+                # rmtree is a long run of unlink/rmdir syscalls that release the
+                # GIL, so independent session trees are removed concurrently.
+                # ignore_errors=True ensures individual file permission issues
                 # don't stop the entire cleanup process
-                shutil.rmtree(folder, ignore_errors=True)
+                remove_tree = partial(shutil.rmtree, ignore_errors=True)
+                with ThreadPoolExecutor(max_workers=min(_RMTREE_WORKERS, len(old_folders))) as pool:
+                    list(pool.map(remove_tree, old_folders))
 
+            for folder in old_folders:
                 # Verify deletion was successful
-                if not folder.exists():
-                    self.logger.info("Old session folder deleted", path=str(folder))
+                if not os.path.lexists(folder):
+                    self.logger.info("Old session folder deleted", path=folder)
                 else:
-                    self.logger.warning("Failed to completely delete session", path=str(folder))
+                    self.logger.warning("Failed to completely delete session", path=folder)
 
         except Exception as e:
             self.logger.error("Error cleaning old sessions", error=str(e))
@@ -1,56 +1,70 @@
 import sys
 from dotenv import load_dotenv
-import pandas as pd
 from logger.custom_logger import CustomLogger
 from exception.custom_exception import DocumentPortalException
 from data_model.schemas import *
 from prompt.prompt_library import PROMPT_REGISTRY
-from utils.model_loader import ModelLoader
+from utils.model_loader import get_model_loader
 from langchain_core.output_parsers import JsonOutputParser
 from langchain.output_parsers import OutputFixingParser
-from typing import List, Dict
+from typing import List, Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_logger = CustomLogger().get_logger(__name__)
+
+_COMPARISON_COLUMNS = ["Page", "Changes"]
+
+# pandas is only needed to shape comparison results, so it is imported on
+# first use rather than by every module that imports this one
+_pandas = None
+
+def _get_pandas():
+    global _pandas
+    if _pandas is None:
+        import pandas
+        _pandas = pandas
+    return _pandas
 
 class DocumentComparatorLLM:
 
     def __init__(self):
-        self.logger = CustomLogger().get_logger(__name__)
+        self.logger = _logger
 
         try:
-            # Initialize the chain to None for lazy loading
-            # This improves startup performance by deferring chain creation
-            self._chain = None
-
             # Initialize model loader and load llm
-            self.loader = ModelLoader()
+            self.loader = get_model_loader()
             self.llm = self.loader.load_llm()
 
             # Prepare JSON output parsers for structured data extraction
             # Primary parser converts LLM output to Pydantic SummaryResponse objects
             self.parser = JsonOutputParser(pydantic_object=SummaryResponse)
-
+            # The schema description is fixed per parser, so render it once
+            self._format_instructions = self.parser.get_format_instructions()
 
             # Store the document analysis prompt template from the registry
             # PROMPT_REGISTRY centralizes all prompt templates for maintainability
-            self.prompt = PROMPT_REGISTRY[PromptType.DOCUMENT_COMPARISON.value]
+            self.prompt = PROMPT_REGISTRY[PromptType.DOCUMENT_COMPARISON.value]()
+
+            # Backup parser that can fix malformed JSON using the LLM, so a
+            # near-valid reply is repaired instead of re-running the comparison
+            self.fixing_parser = OutputFixingParser.from_llm(
+                parser=self.parser,
+                llm=self.llm
+                )
+
+            # Build the processing pipeline: prompt -> LLM -> fixing parser
+            self._chain = self.prompt | self.llm | self.fixing_parser
             self.logger.info("DocumentComparatorLLM initialized successfully")
 
         except Exception as e:
             self.logger.error(str(e))
             raise DocumentPortalException(e)
 
-    @property
-    def chain(self):
-        # Create chain only when first accessed (lazy initialization)
-        if self._chain == None:
-            # Build the processing pipeline: prompt -> LLM -> parser
-            self._chain = self.prompt | self.llm | self.parser
-            self.logger.info("LLM chain initialized")    
-
-        return self._chain
-
     def compare_documents(self, 
                           ref_file_content:str, 
-                          actual_file_content:str) -> pd.DataFrame:
+                          actual_file_content:str) -> "pd.DataFrame":
         """
         Run page-wise comparison between two PDF contents using LLM.
         
@@ -66,12 +80,15 @@ class DocumentComparatorLLM:
             inputs = {
                 "doc_v1": ref_file_content,
                 "doc_v2": actual_file_content, 
-                "format_instruction": self.parser.get_format_instructions()
+                "format_instruction": self._format_instructions
             }
 
-            self.logger.info("Starting document comparison", inputs=inputs)
-            response = self.chain.invoke(inputs)
-            self.logger.info("Documents compared successfully", response=response)
+            self.logger.info("Starting document comparison",
+                             ref_len=len(ref_file_content),
+                             actual_len=len(actual_file_content))
+            response = self._chain.invoke(inputs)
+            self.logger.info("Documents compared successfully",
+                             response_rows=len(response) if hasattr(response, "__len__") else None)
             return self._format_response(response)
 
         except Exception as e:
@@ -79,10 +96,11 @@ class DocumentComparatorLLM:
             raise DocumentPortalException(e)
 
 
-    def _format_response(self, response_parsed: List[Dict]) -> pd.DataFrame:
+    def _format_response(self, response_parsed: List[Dict]) -> "pd.DataFrame":
         try:
-            df = pd.DataFrame(response_parsed)
-            self.logger.info("Response formatted into dataframe", dataframe=df)
+            df = _get_pandas().DataFrame.from_records(response_parsed, columns=_COMPARISON_COLUMNS)
+            self.logger.info("Response formatted into dataframe",
+                             rows=len(df), cols=list(df.columns))
             return df
         except Exception as e:
             self.logger.error(f"Error formatting response into Dataframe: {e}")
@@ -7,9 +7,11 @@ from logger.custom_logger import CustomLogger
 from exception.custom_exception import DocumentPortalException
 from utils.model_loader import ModelLoader
 
+_logger = CustomLogger().get_logger(__name__)
+
 class SingleDocIngestor:
     def __init__(self):
-        self.logger = CustomLogger().get_logger(__name__)
+        self.logger = _logger
         try:
             pass
         except Exception as e:
@@ -12,9 +12,11 @@ from exception.custom_exception import DocumentPortalException
 from prompt.prompt_library import PROMPT_REGISTRY
 from data_model.schemas import PromptType
 
+_logger = CustomLogger().get_logger(__name__)
+
 class ConversationalRAG:
     def __init__(self, session_id:str, retriever)-> None:
-        self.logger = CustomLogger().get_logger(__name__)
+        self.logger = _logger
         try:
             pass
         except Exception as e:
@@ -61,10 +61,11 @@ def test_compare_documents():
     actual_upload = FakeUpload(actual_path)
 
     doc_ingestion = DocumentIngestion()
-    ref_file, actual_file = doc_ingestion.save_uploaded_files(ref_upload, actual_upload)
 
-    ref_file_content = doc_ingestion.read_pdf(ref_file)
-    actual_file_content = doc_ingestion.read_pdf(actual_file)
+    # Parse the upload buffers directly; save_uploaded_files() is only needed
+    # when the files must be kept on disk (e.g. for combine_documents)
+    ref_file_content = doc_ingestion.read_pdf_bytes(ref_upload.get_buffer(), ref_upload.name)
+    actual_file_content = doc_ingestion.read_pdf_bytes(actual_upload.get_buffer(), actual_upload.name)
 
     #combined_text = doc_ingestion.combine_documents()
     
@@ -0,0 +1,21 @@
+from typing import Any
+import orjson
+from langchain_core.output_parsers import JsonOutputParser
+
+
+class FastJsonOutputParser(JsonOutputParser):
+    """
+    JsonOutputParser with an orjson fast path.
+
+    Well-formed JSON replies (the common case) are decoded directly by orjson.
+    Anything else - markdown-fenced JSON, stray prose, truncated output - falls
+    back to JsonOutputParser's tolerant parsing, which raises
+    OutputParserException on failure so an OutputFixingParser wrapper can still
+    repair the reply.
+    """
+
+    def parse(self, text: str) -> Any:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return super().parse(text)
@@ -1,6 +1,74 @@
+import functools
+import hashlib
+import os
+import tempfile
+from typing import Optional
+import orjson
 import yaml
 
+# libyaml's C parser when PyYAML was built with it, else the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+def _snapshot_path(config_path: str) -> str:
+    # One snapshot per config file, under the user's cache directory
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    digest = hashlib.sha1(os.path.abspath(config_path).encode()).hexdigest()[:16]
+    return os.path.join(cache_root, "document_portal", f"config-{digest}.json")
+
+def _read_snapshot(snapshot_path: str, source_stat: os.stat_result) -> Optional[dict]:
+    # A snapshot is only valid for the exact source file it was taken from
+    try:
+        with open(snapshot_path, "rb") as f:
+            snapshot = orjson.loads(f.read())
+        mtime_ns, size, config = snapshot["mtime_ns"], snapshot["size"], snapshot["config"]
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        return None
+    if (mtime_ns, size) != (source_stat.st_mtime_ns, source_stat.st_size):
+        return None
+    return config
+
+def _write_snapshot(snapshot_path: str, source_stat: os.stat_result, config: dict) -> None:
+    # Best effort: written to a temp file and renamed so readers never see a
+    # partial snapshot; any failure just means the next load parses YAML again
+    tmp_path = None
+    try:
+        data = orjson.dumps({
+            "mtime_ns": source_stat.st_mtime_ns,
+            "size": source_stat.st_size,
+            "config": config,
+        })
+        # orjson would silently turn YAML-only values (dates, ...) into strings;
+        # only snapshot configs that survive the JSON round trip unchanged
+        if orjson.loads(data)["config"] != config:
+            return
+        snapshot_dir = os.path.dirname(snapshot_path)
+        os.makedirs(snapshot_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=snapshot_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, snapshot_path)
+    except (OSError, orjson.JSONEncodeError):
+        # JSONEncodeError: values JSON has no form for (sets, non-string keys, ...)
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+@functools.lru_cache(maxsize=8)
 def load_config(config_path:str = "config/config.yaml") -> dict:
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-        return config
+    # Parsed once per path and shared: callers must treat the result as read-only.
+    # Across processes, the parsed dict is reused from a JSON snapshot (decoded
+    # by orjson, far cheaper than a YAML parse) for as long as the YAML file's
+    # mtime and size are unchanged
+    source_stat = os.stat(config_path)
+    snapshot_path = _snapshot_path(config_path)
+    config = _read_snapshot(snapshot_path, source_stat)
+    if config is None:
+        with open(config_path, "r") as f:
+            config = yaml.load(f, Loader=_SafeLoader)
+        _write_snapshot(snapshot_path, source_stat, config)
+    return config
@@ -0,0 +1,59 @@
+import errno
+import io
+import os
+import stat
+import tempfile
+from typing import Optional, Tuple
+
+def sendfile_source(stream) -> Optional[Tuple[int, int]]:
+    """
+    Return (fd, offset) if the stream is backed by a regular on-disk file.
+
+    Such streams (an open file, a rolled-over SpooledTemporaryFile) can be
+    copied with os.sendfile() entirely in kernel space. Returns None for
+    in-memory buffers, pipes/sockets, or platforms without sendfile, so the
+    caller falls back to a buffered copy.
+    """
+    if not hasattr(os, "sendfile"):
+        return None
+    # fileno() on a spooled upload still under its rollover threshold would
+    # first write it to disk; copy those from memory instead
+    if isinstance(stream, tempfile.SpooledTemporaryFile) and not getattr(stream, "_rolled", True):
+        return None
+    try:
+        fd = stream.fileno()
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            return None
+        return fd, stream.tell()
+    except (AttributeError, io.UnsupportedOperation, OSError, ValueError):
+        # No fileno() at all, or one that refuses (BytesIO, closed files)
+        return None
+
+def sendfile_copy(src_fd: int, out_fd: int, offset: int, count: int) -> Optional[int]:
+    """
+    Copy count bytes of src_fd, starting at offset, to out_fd with os.sendfile().
+
+    Args:
+        src_fd (int): Source descriptor, as returned by sendfile_source()
+        out_fd (int): Destination descriptor, written at its current position
+        offset (int): Source offset to start from; src_fd's position is untouched
+        count (int): Number of bytes to copy
+
+    Returns:
+        Optional[int]: Bytes copied (fewer if the source shrank), or None if
+        the kernel cannot sendfile between these descriptors and nothing was
+        copied, in which case the caller falls back to a buffered copy
+    """
+    pos, end = offset, offset + count
+    while pos < end:
+        try:
+            sent = os.sendfile(out_fd, src_fd, pos, end - pos)
+        except OSError as e:
+            if pos == offset and e.errno in (errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP):
+                return None
+            raise
+        if sent == 0:
+            # Source shrank underneath us
+            break
+        pos += sent
+    return pos - offset
@@ -1,18 +1,107 @@
-import os, sys
-from typing import Dict, Any
-from dotenv import load_dotenv
+from __future__ import annotations
+
+import os
+import functools
+import threading
+from pathlib import Path
+from typing import Dict, Any, Callable, Iterable, Optional, Tuple, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from dotenv import dotenv_values
 from utils.config_loader import load_config
 
-from langchain_google_genai import GoogleGenerativeAIEmbeddings, ChatGoogleGenerativeAI
-from langchain_groq import ChatGroq
-from langchain_openai import ChatOpenAI
+# Provider SDKs are imported inside the builders below, so a deployment only
+# pays the import cost of the provider it actually uses
+if TYPE_CHECKING:
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings, ChatGoogleGenerativeAI
+    from langchain_groq import ChatGroq
+    from langchain_openai import ChatOpenAI
 
 # For logging and Exception handling
 from logger.custom_logger import CustomLogger
 from exception.custom_exception import DocumentPortalException
-
-# Instantiate CustomLogger
-logger = CustomLogger().get_logger(__name__)
+from data_model.schemas import LLMProviderConfig
+
+# Logger is built on first use, not at import (e.g. when imported only for types)
+@functools.lru_cache(maxsize=None)
+def _logger():
+    return CustomLogger().get_logger(__name__)
+
+
+# Project .env, resolved once: load_dotenv() would search upward for it on every call
+ENV_PATH = Path(__file__).resolve().parents[1] / ".env"
+
+# API key environment variables required by each provider
+_PROVIDER_KEYS: Dict[str, tuple] = {
+    "groq": ("GROQ_API_KEY",),
+    "google": ("GOOGLE_API_KEY",),
+    "openai": ("OPENAI_API_KEY",),
+}
+
+
+# Groq and OpenAI chat clients talk HTTP through httpx; sharing one client
+# lets them reuse pooled keep-alive connections instead of each opening its own
+@functools.lru_cache(maxsize=None)
+def _shared_http_client():
+    import httpx
+    return httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=64, keepalive_expiry=60),
+    )
+
+
+# Client builders, memoized on their full argument tuple: LangChain clients are
+# stateless and thread-safe, so identical settings reuse one instance (and its
+# HTTP session) instead of constructing a new client per load call.
+# Token parameter names differ per provider:
+#  - ChatGoogleGenerativeAI uses `max_output_tokens`
+#  - ChatGroq and ChatOpenAI use `max_tokens`
+@functools.lru_cache(maxsize=8)
+def _build_embeddings(model_name: str, api_key: str) -> GoogleGenerativeAIEmbeddings:
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+    return GoogleGenerativeAIEmbeddings(model=model_name, google_api_key=api_key)
+
+@functools.lru_cache(maxsize=8)
+def _build_google(model_name: str, api_key: str, temperature: float, max_output_tokens: int) -> ChatGoogleGenerativeAI:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    return ChatGoogleGenerativeAI(
+        model=model_name,
+        google_api_key=api_key,
+        temperature=temperature,
+        max_output_tokens=max_output_tokens,
+    )
+
+@functools.lru_cache(maxsize=8)
+def _build_groq(model_name: str, api_key: str, temperature: float, max_output_tokens: int) -> ChatGroq:
+    from langchain_groq import ChatGroq
+    return ChatGroq(
+        model=model_name,
+        api_key=api_key,
+        temperature=temperature,
+        max_tokens=max_output_tokens,
+        http_client=_shared_http_client(),
+    )
+
+@functools.lru_cache(maxsize=8)
+def _build_openai(model_name: str, api_key: str, temperature: float, max_output_tokens: int) -> ChatOpenAI:
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(
+        model=model_name,
+        api_key=api_key,
+        temperature=temperature,
+        max_tokens=max_output_tokens,
+        http_client=_shared_http_client(),
+    )
+
+@functools.lru_cache(maxsize=None)
+def _prewarm_executor() -> ThreadPoolExecutor:
+    # Background client construction for ModelLoader.prewarm
+    return ThreadPoolExecutor(max_workers=3, thread_name_prefix="llm-prewarm")
+
+# Chat model builders by config "provider", with the API key each one needs
+_LLM_BUILDERS: Dict[str, tuple] = {
+    "google": ("GOOGLE_API_KEY", _build_google),
+    "groq": ("GROQ_API_KEY", _build_groq),
+    "openai": ("OPENAI_API_KEY", _build_openai),
+}
 
 class ModelLoader:
     """
@@ -55,15 +144,65 @@ class ModelLoader:
     def __init__(self)-> None:
         """Initialize loader, load .env, validate config, and prepare keys."""
 
-        load_dotenv()
+        # Same semantics as load_dotenv(): variables already set in the
+        # environment win over .env entries, and value-less entries are skipped
+        for key, value in dotenv_values(ENV_PATH).items():
+            if value is not None:
+                os.environ.setdefault(key, value)
+        self.refresh_env()
         self.config: Dict[str, Any] = load_config()
         if not isinstance(self.config, dict):
-            logger.error("Config loader did not return a dictionary")
+            _logger().error("Config loader did not return a dictionary")
             raise DocumentPortalException(
                 TypeError("Config must be a dictionary")
             )
-        logger.info("Configuration successfully loaded!", config_keys=list(self.config.keys()))
+        _logger().info("Configuration successfully loaded!", config_keys=list(self.config.keys()))
+
+        # Validate every llm entry once; load_llm then only looks them up.
+        # A malformed entry is reported here but only fails when selected
+        self._llm_configs: Dict[str, LLMProviderConfig] = {}
+        llm_block = self.config.get("llm")
+        if isinstance(llm_block, dict):
+            for provider_key, llm_config in llm_block.items():
+                try:
+                    self._llm_configs[provider_key] = LLMProviderConfig.model_validate(llm_config or {})
+                except ValueError as e:
+                    _logger().warning("Invalid LLM config entry", provider=provider_key, error=str(e))
+
+
+    def refresh_env(self) -> None:
+        """
+        Re-read the process environment into the loader's snapshot.
 
+        Keys and LLM_PROVIDER are looked up in a plain dict taken at
+        construction time, and provider API keys are validated against it;
+        call this if os.environ changes afterwards.
+        """
+        # Decode the raw bytes environment directly, once per entry, instead of
+        # going through os.environ's per-item decoding mapping (POSIX only)
+        if os.supports_bytes_environ:
+            self._env: Dict[str, str] = {
+                os.fsdecode(key): os.fsdecode(value) for key, value in os.environb.items()
+            }
+        else:
+            self._env = dict(os.environ)
+        # Clients prewarmed with the previous snapshot's keys are discarded
+        self._prewarmed: Dict[str, Future] = {}
+
+        # Validate every provider's keys in one pass. Missing keys are only
+        # warnings here: a deployment typically configures a single provider,
+        # and _require_api_key fails when a missing one is actually needed
+        self._keys: Dict[str, str] = {}
+        missing = []
+        for key_names in _PROVIDER_KEYS.values():
+            for key_name in key_names:
+                val = self._env.get(key_name)
+                if val:
+                    self._keys[key_name] = val
+                else:
+                    missing.append(key_name)
+        if missing:
+            _logger().warning("API keys not set; their providers are unavailable", missing_vars=missing)
 
     def _require_api_key(self, key_name: str) -> str:
         """
@@ -85,14 +224,10 @@ class ModelLoader:
             If the key is missing or empty.
         """
 
-        val = os.getenv(key_name)
-        if not val:
-            logger.error("Missing environment variable", missing_var=key_name)
-            try:
-                raise ValueError(f"Missing environmemt variable: {key_name}")
-            except Exception as e:
-                # Wrap with custom exception for consistent handling
-                raise DocumentPortalException(e) from e
+        val = self._keys.get(key_name)
+        if val is None:
+            _logger().error("Missing environment variable", missing_var=key_name)
+            raise DocumentPortalException(f"Missing environment variable: {key_name}")
         return val
 
     def load_embeddings(self)-> GoogleGenerativeAIEmbeddings:
@@ -111,7 +246,7 @@ class ModelLoader:
         """
 
         try:
-            logger.info("Loading the embedding model")
+            _logger().info("Loading the embedding model")
             emb_cfg = self.config.get("embedding_model") or {}
             model_name = emb_cfg.get("model_name")
             if not model_name:
@@ -120,11 +255,14 @@ class ModelLoader:
             # Ensure Google key present since we are going to use Google Embeddings
             google_key = self._require_api_key("GOOGLE_API_KEY")
 
-            return GoogleGenerativeAIEmbeddings(
-                model=model_name,
-                google_api_key=google_key)
+            return _build_embeddings(model_name, google_key)
+        except DocumentPortalException:
+            # Already logged where it was raised
+            raise
         except Exception as e:
-            logger.exception("Failed to load embedding model")
+            # The traceback travels with the chained exception; whoever handles
+            # it can log it once instead of rendering it here as well
+            _logger().error("Failed to load embedding model", error=str(e))
             raise DocumentPortalException(e) from e
 
     def load_llm(self):
@@ -148,74 +286,135 @@ class ModelLoader:
             If configuration is missing/invalid or the model fails to initialize.
         """
         try:
-
-            llm_block = self.config.get("llm")
-            if not isinstance(llm_block, dict) or not llm_block:
-                raise KeyError("Missing or invalid 'llm' block in config")
-            
             # Default provider: Groq if no LLM_PROVIDER is set .env
-            provider_key = os.getenv("LLM_PROVIDER", "groq")
-            logger.info(f"Loaded the provider: {provider_key}")
-
-            if provider_key not in llm_block:
-                raise KeyError(f"Provider '{provider_key} not found in the config['llm']")
-        
-            llm_config = llm_block[provider_key] or {}
-            provider = llm_config.get("provider")
-            model_name = llm_config.get("model_name")
-            temperature = float(llm_config.get("temperature", 0.2))
-            max_output_tokens = int(llm_config.get("max_output_tokens", 2048))
-
-            if not provider or not model_name:
-                raise KeyError(f"Missing provider/model_name in llm['{provider_key}']")
-
-            logger.info(
-                "Loading LLM",
-                provider=provider,
-                model_name=model_name,
-                temperature=temperature,
-                max_output_tokens=max_output_tokens,
-            )
-
-            # Normalize token parameter names:
-            #  - ChatGoogleGenerativeAI uses `max_output_tokens`
-            #  - ChatGroq and ChatOpenAI use `max_tokens`
-            if provider == "google":
-                self._require_api_key("GOOGLE_API_KEY")  # Ensure present
-                return ChatGoogleGenerativeAI(
-                    model=model_name,
-                    temperature=temperature,
-                    max_output_tokens=max_output_tokens,
-                )
-
-            if provider == "groq":
-                groq_key = self._require_api_key("GROQ_API_KEY")
-                return ChatGroq(
-                    model=model_name,
-                    api_key=groq_key,
-                    temperature=temperature,
-                    max_tokens=max_output_tokens,
-                )
-
-            if provider == "openai":
-                openai_key = self._require_api_key("OPENAI_API_KEY")
-                return ChatOpenAI(
-                    model=model_name,
-                    api_key=openai_key,
-                    temperature=temperature,
-                    max_tokens=max_output_tokens, 
-                )
-
-            raise ValueError(f"Unsupported LLM provider: {provider}")
-
+            provider_key = self._env.get("LLM_PROVIDER", "groq")
+
+            # A prewarm() for this provider already built (or is building) it
+            llm = None
+            future = self._prewarmed.get(provider_key)
+            if future is not None:
+                try:
+                    llm = future.result()
+                except Exception as e:
+                    # Drop the failed build so this and later calls retry it
+                    # here instead of re-raising the cached error
+                    self._prewarmed.pop(provider_key, None)
+                    _logger().warning("Prewarmed LLM build failed; rebuilding",
+                                      provider=provider_key, error=str(e))
+
+            if llm is None:
+                build, args = self._resolve_llm(provider_key)
+                llm = build(*args)
+
+            _logger().info(f"Loaded the provider: {provider_key}")
+            return llm
+
+        except DocumentPortalException:
+            # Already logged where it was raised
+            raise
         except Exception as e:
-            logger.exception("Failed to load LLM")
+            # The traceback travels with the chained exception; whoever handles
+            # it can log it once instead of rendering it here as well
+            _logger().error("Failed to load LLM", error=str(e))
             raise DocumentPortalException(e) from e
 
-        
+    def prewarm(self, providers: Optional[Iterable[str]] = None) -> None:
+        """
+        Start building chat models in a background thread.
+
+        A later load_llm() for a prewarmed provider waits on that build
+        instead of constructing the client itself, so entry points can
+        overlap client construction with other start-up work. Best effort:
+        a provider that cannot be resolved is skipped with a warning and
+        reported by load_llm() if it is actually used.
+
+        Parameters
+        ----------
+        providers : Iterable[str], optional
+            Keys under config["llm"]; defaults to the LLM_PROVIDER selection.
+        """
+        if providers is None:
+            providers = (self._env.get("LLM_PROVIDER", "groq"),)
+        for provider_key in providers:
+            if provider_key in self._prewarmed:
+                continue
+            try:
+                build, args = self._resolve_llm(provider_key)
+            except Exception as e:
+                _logger().warning("Skipping LLM prewarm", provider=provider_key, error=str(e))
+                continue
+            self._prewarmed[provider_key] = _prewarm_executor().submit(build, *args)
+
+    def _resolve_llm(self, provider_key: str) -> Tuple[Callable[..., Any], tuple]:
+        """
+        Resolve config["llm"][provider_key] into its builder and arguments.
+
+        Raises
+        ------
+        KeyError
+            If the llm block, the provider entry or its required fields are missing.
+        ValueError
+            If the provider is not supported.
+        DocumentPortalException
+            If the provider's API key is not set.
+        """
+        llm_block = self.config.get("llm")
+        if not isinstance(llm_block, dict) or not llm_block:
+            raise KeyError("Missing or invalid 'llm' block in config")
+
+        if provider_key not in llm_block:
+            raise KeyError(f"Provider '{provider_key} not found in the config['llm']")
+
+        llm_config = self._llm_configs.get(provider_key)
+        if llm_config is None:
+            raise KeyError(f"Missing or invalid provider/model_name in llm['{provider_key}']")
+
+        _logger().info(
+            "Loading LLM",
+            provider=llm_config.provider,
+            model_name=llm_config.model_name,
+            temperature=llm_config.temperature,
+            max_output_tokens=llm_config.max_output_tokens,
+        )
+
+        # Table-driven dispatch: provider -> (API key variable, builder)
+        if llm_config.provider not in _LLM_BUILDERS:
+            raise ValueError(f"Unsupported LLM provider: {llm_config.provider}")
+        key_name, build = _LLM_BUILDERS[llm_config.provider]
+        return build, (llm_config.model_name, self._require_api_key(key_name),
+                       llm_config.temperature, llm_config.max_output_tokens)
+
+
+# Process-wide loader, built on first use (see get_model_loader)
+_INSTANCE: Optional[ModelLoader] = None
+_LOCK = threading.Lock()
+
+def get_model_loader() -> ModelLoader:
+    """
+    Return the shared ModelLoader, creating it on first call.
+
+    The .env file and the YAML config are therefore read once per process
+    instead of once per analyzer/comparator instance.
+
+    Returns
+    -------
+    ModelLoader
+        The process-wide loader instance.
+    """
+    global _INSTANCE
+    if _INSTANCE is None:
+        with _LOCK:
+            # Re-check under the lock so concurrent first callers build it once
+            if _INSTANCE is None:
+                _INSTANCE = ModelLoader()
+    return _INSTANCE
+
+
 if __name__ == "__main__":
     try:
-        mdl_loader = ModelLoader()
+        mdl_loader = get_model_loader()
+        # Build the LLM client while the embedding model loads
+        mdl_loader.prewarm()
 
         # test embedding model
         emb_model = mdl_loader.load_embeddings()
@@ -225,12 +424,20 @@ if __name__ == "__main__":
         llm_model = mdl_loader.load_llm()
         print(f"LLM loaded: {llm_model}")
 
-        # Test the working of LLM model
-        result = llm_model.invoke("Hello, How are you doing today?")
-        print(f"LLM response: {getattr(result, 'content', result)}")
+        # Test the working of LLM model: a real (billed) API round trip, so
+        # only when asked for with MODEL_LOADER_SMOKE=1
+        if os.environ.get("MODEL_LOADER_SMOKE", "0") == "1":
+            try:
+                result = llm_model.invoke("Hello, How are you doing today?")
+                print(f"LLM response: {getattr(result, 'content', result)}")
+            except Exception as e:
+                # Logged once by the handler below
+                raise DocumentPortalException(e) from e
+        else:
+            print("Skipping LLM invoke (set MODEL_LOADER_SMOKE=1 to run it)")
 
     except DocumentPortalException as e:
         # Custom exception already captures rich context/traceback.
         # logger.exception will include stacktrace in structured logs.
-        logger.exception("Fatal error during model loading or inference", error=str(e))
+        _logger().exception("Fatal error during model loading or inference", error=str(e))
         raise
\ No newline at end of file
@@ -0,0 +1,152 @@
+import os
+from typing import Dict, Iterator, Optional, Protocol, Tuple, Union
+
+import fitz
+
+# A PDF on disk (path) or in memory (raw bytes, e.g. an upload buffer)
+PdfSource = Union[str, bytes]
+
+
+def _source_name(source: PdfSource) -> str:
+    """File name for messages; in-memory PDFs have none."""
+    return "<memory>" if isinstance(source, (bytes, bytearray)) else os.path.basename(source)
+
+
+class PdfBackend(Protocol):
+    """
+    Pluggable PDF text extractor.
+
+    Implementations must be stateless and defined at module level so they can
+    be pickled into worker processes, which call them with page ranges.
+    """
+
+    name: str
+
+    def page_count(self, source: PdfSource) -> int:
+        """
+        Number of pages in the document.
+
+        Raises:
+            ValueError: If the PDF is encrypted
+        """
+        ...
+
+    def iter_pages(self, source: PdfSource, start: int = 0,
+                   stop: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (1-based page number, plain text) for pages in [start, stop).
+
+        Raises:
+            ValueError: If the PDF is encrypted
+        """
+        ...
+
+
+class FitzBackend:
+    """PyMuPDF extraction (the default)."""
+
+    name = "fitz"
+
+    # PyMuPDF's default "text" flags minus ligature preservation, which LLM
+    # input doesn't need
+    text_flags = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+
+    def page_count(self, source: PdfSource) -> int:
+        with self._open(source) as doc:
+            return doc.page_count
+
+    def iter_pages(self, source: PdfSource, start: int = 0,
+                   stop: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        with self._open(source) as doc:
+            stop = doc.page_count if stop is None else stop
+            for page_num, page in enumerate(doc.pages(start, stop), start + 1):
+                yield page_num, page.get_text("text", flags=self.text_flags)
+
+    @staticmethod
+    def _open(source: PdfSource) -> fitz.Document:
+        if isinstance(source, (bytes, bytearray)):
+            doc = fitz.open(stream=source, filetype="pdf")
+        else:
+            doc = fitz.open(source)
+        # Encrypted PDFs require passwords which we don't handle here
+        if doc.is_encrypted:
+            doc.close()
+            raise ValueError(f"PDF is encrypted: {_source_name(source)}")
+        return doc
+
+
+class PdfiumBackend:
+    """
+    pdfium extraction via pypdfium2 (optional dependency).
+
+    Uses the text page's range API, which is faster than PyMuPDF's
+    layout-aware extraction on text-heavy batch workloads.
+    """
+
+    name = "pdfium"
+
+    def page_count(self, source: PdfSource) -> int:
+        pdf = self._open(source)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+    def iter_pages(self, source: PdfSource, start: int = 0,
+                   stop: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        pdf = self._open(source)
+        try:
+            stop = len(pdf) if stop is None else stop
+            for index in range(start, stop):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                try:
+                    yield index + 1, textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            pdf.close()
+
+    @staticmethod
+    def _open(source: PdfSource):
+        import pypdfium2 as pdfium
+        import pypdfium2.raw as pdfium_c
+
+        try:
+            return pdfium.PdfDocument(source)
+        except pdfium.PdfiumError as e:
+            if getattr(e, "err_code", None) == pdfium_c.FPDF_ERR_PASSWORD:
+                raise ValueError(f"PDF is encrypted: {_source_name(source)}") from e
+            raise
+
+
+_BACKENDS: Dict[str, type] = {
+    FitzBackend.name: FitzBackend,
+    PdfiumBackend.name: PdfiumBackend,
+}
+
+
+def get_pdf_backend(name: Optional[str] = None) -> PdfBackend:
+    """
+    Return the PDF backend registered under name (default: "fitz").
+
+    Args:
+        name (Optional[str]): Backend name, case-insensitive
+
+    Returns:
+        PdfBackend: A backend instance
+
+    Raises:
+        ValueError: If the name is unknown or the backend's library is not installed
+    """
+    name = (name or FitzBackend.name).lower()
+    backend_cls = _BACKENDS.get(name)
+    if backend_cls is None:
+        raise ValueError(f"Unknown pdf_backend {name!r}; expected one of {sorted(_BACKENDS)}")
+    if backend_cls is PdfiumBackend:
+        try:
+            import pypdfium2  # noqa: F401
+        except ImportError as e:
+            raise ValueError("pdf_backend 'pdfium' requires the pypdfium2 package") from e
+    return backend_cls()
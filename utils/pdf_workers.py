@@ -0,0 +1,140 @@
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import fitz
+
+from utils.pdf_backend import PdfBackend, PdfSource
+
+# Code in this module runs in (or is imported by) the PDF extraction worker
+# processes, which are started fresh and import whatever they unpickle, so it
+# imports no logger of its own. Workers still re-import the entry point as
+# __mp_main__; CustomLogger only starts its file handler and listener thread
+# on a process's first record, so a worker that never logs creates neither.
+
+# PyMuPDF is not thread-safe and holds the GIL, so parallel extraction uses
+# processes; with fewer than two there is nothing to gain from a pool
+PDF_WORKERS = min(8, os.cpu_count() or 1)
+
+# Documents with at least this many pages are split across worker processes;
+# below it, IPC and per-worker document opens cost more than serial extraction
+PARALLEL_MIN_PAGES = 32
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+def _pool_context():
+    # Start workers from a clean forkserver (or spawn) rather than fork(): a
+    # forked child inherits the parent's threads' locks in whatever state they
+    # were, e.g. the logging QueueListener's
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+def get_pdf_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Return the process-wide PDF extraction pool, creating it on first use.
+
+    Returns:
+        Optional[ProcessPoolExecutor]: The shared pool, or None when fewer
+        than two workers are available and extraction should run inline
+    """
+    global _pool
+    if PDF_WORKERS < 2:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            # Re-check under the lock so concurrent first callers create one pool
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=_pool_context())
+    return _pool
+
+def discard_pdf_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Drop a pool that raised BrokenProcessPool (a worker crashed or was
+    OOM-killed) so the next get_pdf_pool() call starts a fresh one.
+
+    Args:
+        pool (ProcessPoolExecutor): The broken pool
+    """
+    global _pool
+    with _pool_lock:
+        # Another caller may already have replaced it
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def page_ranges(page_count: int) -> List[Tuple[int, int]]:
+    """Split [0, page_count) into at most PDF_WORKERS contiguous (start, stop) ranges."""
+    step = -(-page_count // PDF_WORKERS)
+    return [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+def extract_page_texts(path: str, start: int, stop: int, flags: int) -> List[str]:
+    """Plain text of pages [start, stop) of the PDF at path; runs in a worker process."""
+    with fitz.open(path) as doc:
+        return [page.get_text("text", flags=flags) for page in doc.pages(start, stop)]
+
+def non_empty_pages(pages: Iterable[Tuple[int, str]]) -> Iterator[Tuple[int, str]]:
+    """Keep only pages with actual text content (skips empty pages or pages with only images)."""
+    for page_num, page_text in pages:
+        if page_text and not page_text.isspace():
+            yield page_num, page_text
+
+def extract_backend_range(backend: PdfBackend, source: PdfSource, start: int, stop: int) -> List[Tuple[int, str]]:
+    """(page_num, text) for the non-empty pages in [start, stop); runs in a worker process."""
+    return list(non_empty_pages(backend.iter_pages(source, start, stop)))
+
+def write_pages(pages: Iterable[Tuple[int, str]]) -> Tuple[str, int]:
+    """Join (page_num, text) pairs with page markers in a single buffer; returns text and page count."""
+    buf = io.StringIO()
+    count = 0
+    for page_num, page_text in pages:
+        if count:
+            buf.write("\n")
+        buf.write(f"\n--- Page {page_num} ---\n")
+        buf.write(page_text)
+        count += 1
+    return buf.getvalue(), count
+
+def extract_pdf_text(pdf_path: Union[Path, bytes],
+                     backend: PdfBackend,
+                     pool: Optional[ProcessPoolExecutor] = None) -> Tuple[str, int, int]:
+    """
+    Extract the text of every non-empty page of a PDF (a path, or the raw
+    bytes of an in-memory PDF) with the given backend.
+
+    Runs in the caller or, for whole files, in a worker process. Given a
+    pool, documents of PARALLEL_MIN_PAGES or more are split into contiguous
+    page ranges, each extracted by a worker with its own document handle,
+    and reassembled in page order. If the pool breaks, it is discarded and
+    the document is extracted inline instead.
+
+    Returns:
+        Tuple[str, int, int]: Combined text with page markers, total page
+        count and number of pages that had text
+
+    Raises:
+        ValueError: If the PDF is encrypted
+    """
+    source = pdf_path if isinstance(pdf_path, (bytes, bytearray)) else str(pdf_path)
+    total_pages = backend.page_count(source)
+    if pool is None or total_pages < PARALLEL_MIN_PAGES:
+        text, pages_with_text = write_pages(non_empty_pages(backend.iter_pages(source)))
+        return text, total_pages, pages_with_text
+
+    try:
+        futures = [
+            pool.submit(extract_backend_range, backend, source, start, stop)
+            for start, stop in page_ranges(total_pages)
+        ]
+        # Futures are listed in page order, so results need no re-sorting
+        text, pages_with_text = write_pages(page for future in futures for page in future.result())
+    except BrokenProcessPool:
+        discard_pdf_pool(pool)
+        text, pages_with_text = write_pages(non_empty_pages(backend.iter_pages(source)))
+    return text, total_pages, pages_with_text